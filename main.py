@@ -1,5 +1,4 @@
 import argparse
-import json
 import os
 import sys
 
@@ -7,9 +6,9 @@ sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "src
 
 import ui
 from config import RunConfig, load_config, validate_config_vars, init_config_wizard, init_config_from_env
-from session import build_session
-from preflight import build_preflight_report, preflight_summary, build_preflight_markdown
-from workflow import run_clone_flow, _setup_dest_context, _offer_save_log
+from session import build_session, SITE_PHASE_POOL_SIZE
+from workflow import (run_clone_flow, _offer_save_log, _start_run_log, _template_name_map,
+                      _run_preflight_with_dest_setup, _write_preflight_report)
 from guided import guided_flow
 
 
@@ -20,6 +19,8 @@ def main():
     parser.add_argument("--init-from-env", action="store_true", help="Create config.ini from environment variables and exit.")
     parser.add_argument("--preflight-json", nargs="?", const="preflight_report.json", help="Write preflight report to a JSON file.")
     parser.add_argument("--preflight", nargs="?", const="preflight_report.md", help="Write preflight report to a Markdown file (default: preflight_report.md).")
+    parser.add_argument("--pretty-preflight", action="store_true", help="Indent and sort keys in the preflight JSON report.")
+    parser.add_argument("--log-file", help="Stream the run log to this Markdown file as the run progresses.")
     parser.add_argument("--guided", action="store_true", help="Run the guided setup flow.")
     args = parser.parse_args()
 
@@ -39,7 +40,7 @@ def main():
             guided_flow(args)
             return
 
-        ui.start_log()
+        _start_run_log(args.log_file)
         selected_section_name, config_dict = load_config()
         cfg = RunConfig.from_dict(config_dict)
 
@@ -49,39 +50,20 @@ def main():
         }
         validate_config_vars(cfg)
         source_base_url = cfg.base_url
-        source_session = build_session(extra_headers=source_headers)
-
-        dest_session, dest_base_url, cross_cloud = _setup_dest_context(source_session, source_base_url)
+        source_session = build_session(extra_headers=source_headers, pool_size=SITE_PHASE_POOL_SIZE,
+                                       base_url=source_base_url)
 
         from guided import collect_run_details
         collect_run_details(source_session, source_base_url, cfg)
 
-        template_name_map = {
-            "switch_template_id": cfg.switch_template_name,
-            "wan_edge_template_id": cfg.wan_edge_template_name,
-            "wlan_template_id": cfg.wlan_template_name,
-            "rftemplate_id": cfg.rf_template_name
-        }
-
-        preflight_report = build_preflight_report(
-            source_session, cfg.source_organization_id,
-            cfg.source_site_id, template_name_map,
-            cfg=cfg,
-            source_base_url=source_base_url,
+        template_name_map = _template_name_map(cfg)
+        preflight_report, dest_session, dest_base_url, cross_cloud = _run_preflight_with_dest_setup(
+            source_session, source_base_url, cfg, template_name_map
         )
-        preflight_summary(preflight_report, template_assignment_mode=cfg.template_assignment_mode)
 
         if args.preflight_json or args.preflight:
-            out_path = args.preflight_json or args.preflight
-            if out_path.endswith(".md") or args.preflight:
-                md_content = build_preflight_markdown(preflight_report,
-                                                      template_assignment_mode=cfg.template_assignment_mode)
-                with open(out_path, "w", encoding="utf-8") as f:
-                    f.write(md_content)
-            else:
-                with open(out_path, "w", encoding="utf-8") as file:
-                    json.dump(preflight_report, file, indent=2, sort_keys=True)
-            ui.ok(f"Preflight report written to {out_path}")
+            _write_preflight_report(preflight_report, args.preflight_json or args.preflight, cfg,
+                                    markdown=bool(args.preflight), pretty=args.pretty_preflight)
 
         if args.dry_run:
             ui.info("Dry-run mode — no changes applied.")
@@ -94,6 +76,8 @@ def main():
 
     except Exception as e:
         ui.error(str(e))
+    finally:
+        ui.stop_log()
 
 
 if __name__ == "__main__":
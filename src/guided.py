@@ -1,6 +1,6 @@
 import ui
 from config import RunConfig, _select_api_profile, validate_config_vars, load_dest_config
-from session import build_session, _paginate, DEFAULT_TIMEOUT
+from session import build_session, _paginate, DEFAULT_TIMEOUT, SITE_PHASE_POOL_SIZE
 from prompts import prompt_input, prompt_yes_no, select_from_list
 from mist.orgs import parse_superuser_details, format_superuser_details
 from mist.templates import prompt_template_assignment_mode
@@ -208,11 +208,10 @@ def collect_run_details(session, base_url, cfg: RunConfig):
 
 
 def guided_flow(args):
-    import json
-    from preflight import build_preflight_report, preflight_summary, build_preflight_markdown
-    from workflow import run_clone_flow, _setup_dest_context, _offer_save_log
+    from workflow import (run_clone_flow, _offer_save_log, _start_run_log, _template_name_map,
+                          _run_preflight_with_dest_setup, _write_preflight_report)
 
-    ui.start_log()
+    _start_run_log(args.log_file)
     ui.banner("Mist Org Clone Tool", "Guided Setup")
     ui.section("Step 1 — Source API Configuration")
 
@@ -225,26 +224,15 @@ def guided_flow(args):
         'Content-Type': 'application/json',
         'Authorization': f'Token {cfg.api_token}'
     }
-    source_session = build_session(extra_headers=source_headers)
-
-    dest_session, dest_base_url, cross_cloud = _setup_dest_context(source_session, source_base_url)
+    source_session = build_session(extra_headers=source_headers, pool_size=SITE_PHASE_POOL_SIZE,
+                                   base_url=source_base_url)
 
     collect_run_details(source_session, source_base_url, cfg)
 
-    template_name_map = {
-        "switch_template_id": cfg.switch_template_name,
-        "wan_edge_template_id": cfg.wan_edge_template_name,
-        "wlan_template_id": cfg.wlan_template_name,
-        "rftemplate_id": cfg.rf_template_name
-    }
-
-    preflight_report = build_preflight_report(
-        source_session, cfg.source_organization_id,
-        cfg.source_site_id, template_name_map,
-        cfg=cfg,
-        source_base_url=source_base_url,
+    template_name_map = _template_name_map(cfg)
+    preflight_report, dest_session, dest_base_url, cross_cloud = _run_preflight_with_dest_setup(
+        source_session, source_base_url, cfg, template_name_map
     )
-    preflight_summary(preflight_report, template_assignment_mode=cfg.template_assignment_mode)
 
     if cross_cloud:
         ui.bullet("Clone mode", f"Cross-cloud  →  {dest_base_url}")
@@ -262,15 +250,8 @@ def guided_flow(args):
             else:
                 report_path = prompt_input("Report filename", default="preflight_report.md")
     if report_path:
-        if report_path.endswith(".md") or args.preflight:
-            md_content = build_preflight_markdown(preflight_report,
-                                                  template_assignment_mode=cfg.template_assignment_mode)
-            with open(report_path, "w", encoding="utf-8") as f:
-                f.write(md_content)
-        else:
-            with open(report_path, "w", encoding="utf-8") as file:
-                json.dump(preflight_report, file, indent=2, sort_keys=True)
-        ui.ok(f"Preflight report written to {report_path}")
+        _write_preflight_report(preflight_report, report_path, cfg,
+                                markdown=bool(args.preflight), pretty=args.pretty_preflight)
 
     if args.dry_run:
         ui.info("Dry-run mode — no changes applied.")
@@ -1 +1,6 @@
-_ORG_RESOURCE_STRIP_FIELDS = {"id", "org_id", "created_time", "modified_time"}
+_ORG_RESOURCE_STRIP_FIELDS = frozenset({"id", "org_id", "created_time", "modified_time"})
+
+
+def _strip(item, extra=frozenset()):
+    skip = _ORG_RESOURCE_STRIP_FIELDS | extra if extra else _ORG_RESOURCE_STRIP_FIELDS
+    return {k: v for k, v in item.items() if k not in skip}
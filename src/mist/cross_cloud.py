@@ -1,12 +1,13 @@
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import ui
-from session import api_request, _paginate
-from mist import _ORG_RESOURCE_STRIP_FIELDS
+from session import api_request, _paginate, _post_many, _response_id
+from mist import _strip
 from mist.sitegroups import fetch_sitegroups
 from mist.orgs import fetch_alarm_templates, clone_alarm_templates
+from mist.templates import fetch_template_list
 
-_SERVICEPOLICY_STRIP_FIELDS = {"id", "org_id", "created_time", "modified_time"}
+_BOOTSTRAP_TEMPLATE_ENDPOINTS = ("networktemplates", "rftemplates", "templates", "gatewaytemplates")
 
 
 def remap_gateway_template_service_policies(session, source_org_id, new_org_id,
@@ -41,7 +42,7 @@ def remap_gateway_template_service_policies(session, source_org_id, new_org_id,
         name = policy.get("name")
         if not name or name in new_name_to_id:
             continue
-        payload = {k: v for k, v in policy.items() if k not in _SERVICEPOLICY_STRIP_FIELDS}
+        payload = _strip(policy)
         try:
             response = api_request(_dst_sess, "POST", create_url, payload=payload, ok_status=(200, 201))
             new_id = response.json().get("id")
@@ -123,7 +124,21 @@ def remap_gateway_template_service_policies(session, source_org_id, new_org_id,
 
 
 def cross_cloud_bootstrap_org(source_session, dest_session, source_org_id,
-                               new_org_name, source_base_url, dest_base_url):
+                               new_org_name, source_base_url, dest_base_url,
+                               _cached_alarm_templates=None):
+    prefetch = ThreadPoolExecutor(max_workers=len(_BOOTSTRAP_TEMPLATE_ENDPOINTS) + 2)
+    source_sgs_future = prefetch.submit(
+        fetch_sitegroups, source_session, source_org_id, base_url=source_base_url
+    )
+    source_futures = {
+        endpoint: prefetch.submit(fetch_template_list, source_session, source_org_id, endpoint, source_base_url)
+        for endpoint in _BOOTSTRAP_TEMPLATE_ENDPOINTS
+    }
+    source_futures["servicepolicies"] = prefetch.submit(
+        _paginate, source_session, f"{source_base_url}/orgs/{source_org_id}/servicepolicies"
+    )
+    prefetch.shutdown(wait=False)
+
     ui.progress("Creating blank organization on destination cloud …")
     org_url = f"{dest_base_url}/orgs"
     response = api_request(dest_session, "POST", org_url,
@@ -132,35 +147,33 @@ def cross_cloud_bootstrap_org(source_session, dest_session, source_org_id,
     ui.ok(f"Blank organization created  →  ID: {new_org_id}")
 
     ui.progress("Copying site groups …")
-    source_sgs = fetch_sitegroups(source_session, source_org_id, base_url=source_base_url)
+    source_sgs = source_sgs_future.result()
     sg_url = f"{dest_base_url}/orgs/{new_org_id}/sitegroups"
+    sg_payloads = [_strip(sg) for sg in source_sgs]
     sg_ok = 0
-    for sg in source_sgs:
-        payload = {k: v for k, v in sg.items() if k not in _ORG_RESOURCE_STRIP_FIELDS}
-        try:
-            api_request(dest_session, "POST", sg_url, payload=payload, ok_status=(200, 201))
-            sg_ok += 1
-        except Exception as exc:
+    for sg, (_, exc) in zip(source_sgs, _post_many(dest_session, sg_url, sg_payloads)):
+        if exc:
             ui.warn(f"Sitegroup '{sg.get('name')}' skipped: {exc}")
+            continue
+        sg_ok += 1
     ui.ok(f"Site groups copied: {sg_ok}/{len(source_sgs)}")
 
     ui.progress("Copying service policies …")
-    source_policies = _paginate(source_session, f"{source_base_url}/orgs/{source_org_id}/servicepolicies")
-    sp_id_map: dict = {}
+    source_policies = source_futures["servicepolicies"].result()
     sp_create_url = f"{dest_base_url}/orgs/{new_org_id}/servicepolicies"
+    sp_payloads = [_strip(policy) for policy in source_policies]
+    sp_results = _post_many(dest_session, sp_create_url, sp_payloads, parse=_response_id)
+    sp_id_map = {
+        policy["id"]: new_id
+        for policy, (new_id, exc) in zip(source_policies, sp_results)
+        if not exc and new_id and policy.get("id")
+    }
     sp_ok = 0
-    for policy in source_policies:
-        old_id = policy.get("id")
-        payload = {k: v for k, v in policy.items() if k not in _ORG_RESOURCE_STRIP_FIELDS}
-        try:
-            resp = api_request(dest_session, "POST", sp_create_url,
-                               payload=payload, ok_status=(200, 201))
-            new_id = resp.json().get("id")
-            if old_id and new_id:
-                sp_id_map[old_id] = new_id
-            sp_ok += 1
-        except Exception as exc:
+    for policy, (_, exc) in zip(source_policies, sp_results):
+        if exc:
             ui.warn(f"Service policy '{policy.get('name')}' skipped: {exc}")
+            continue
+        sp_ok += 1
     ui.ok(f"Service policies copied: {sp_ok}/{len(source_policies)}")
 
     parallel_tasks = [
@@ -170,51 +183,52 @@ def cross_cloud_bootstrap_org(source_session, dest_session, source_org_id,
     ]
 
     def _copy_template_type(label, endpoint):
-        items = _paginate(source_session, f"{source_base_url}/orgs/{source_org_id}/{endpoint}")
+        items = source_futures[endpoint].result()
         create_url = f"{dest_base_url}/orgs/{new_org_id}/{endpoint}"
-        t_ok = 0
-        for item in items:
-            payload = {k: v for k, v in item.items() if k not in _ORG_RESOURCE_STRIP_FIELDS}
-            try:
-                api_request(dest_session, "POST", create_url, payload=payload, ok_status=(200, 201))
-                t_ok += 1
-            except Exception as exc:
-                ui.warn(f"{label} template '{item.get('name')}' skipped: {exc}")
-        return label, t_ok, len(items)
+        payloads = [_strip(item) for item in items]
+        skipped = [
+            (item.get("name"), exc)
+            for item, (_, exc) in zip(items, _post_many(dest_session, create_url, payloads))
+            if exc
+        ]
+        return label, len(items) - len(skipped), len(items), skipped
 
     ui.progress("Copying Switch, RF and WLAN templates in parallel …")
     with ThreadPoolExecutor(max_workers=3) as _ex:
         _template_futures = {_ex.submit(_copy_template_type, lbl, ep): lbl
                              for lbl, ep in parallel_tasks}
         for _future in as_completed(_template_futures):
-            _lbl, _t_ok, _total = _future.result()
+            _lbl, _t_ok, _total, _skipped = _future.result()
+            for _name, _exc in _skipped:
+                ui.warn(f"{_lbl} template '{_name}' skipped: {_exc}")
             ui.ok(f"{_lbl} templates copied: {_t_ok}/{_total}")
 
     ui.progress("Copying WAN Edge templates …")
-    gw_items = _paginate(source_session, f"{source_base_url}/orgs/{source_org_id}/gatewaytemplates")
+    gw_items = source_futures["gatewaytemplates"].result()
     gw_create_url = f"{dest_base_url}/orgs/{new_org_id}/gatewaytemplates"
-    gw_ok = 0
+    gw_payloads = []
     for item in gw_items:
-        payload = {k: v for k, v in item.items() if k not in _ORG_RESOURCE_STRIP_FIELDS}
-        old_svc = payload.get("service_policies") or []
-        remapped = []
-        for entry in old_svc:
-            src_sp_id = entry.get("servicepolicy_id")
-            if src_sp_id:
-                remapped.append({**entry, "servicepolicy_id": sp_id_map.get(src_sp_id, src_sp_id)})
-            else:
-                remapped.append(entry)
-        payload["service_policies"] = remapped
-        try:
-            api_request(dest_session, "POST", gw_create_url, payload=payload, ok_status=(200, 201))
-            gw_ok += 1
-        except Exception as exc:
+        payload = _strip(item)
+        old_svc = payload.get("service_policies")
+        if sp_id_map and old_svc:
+            payload["service_policies"] = [
+                {**entry, "servicepolicy_id": sp_id_map[entry["servicepolicy_id"]]}
+                if entry.get("servicepolicy_id") in sp_id_map else entry
+                for entry in old_svc
+            ]
+        gw_payloads.append(payload)
+    gw_ok = 0
+    for item, (_, exc) in zip(gw_items, _post_many(dest_session, gw_create_url, gw_payloads)):
+        if exc:
             ui.warn(f"WAN Edge template '{item.get('name')}' skipped: {exc}")
+            continue
+        gw_ok += 1
     ui.ok(f"WAN Edge templates copied: {gw_ok}/{len(gw_items)}")
 
     clone_alarm_templates(
         source_session, dest_session, source_org_id, new_org_id,
         source_base_url=source_base_url, dest_base_url=dest_base_url,
+        _cached_alarm_templates=_cached_alarm_templates,
     )
 
     return new_org_id
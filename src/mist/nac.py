@@ -1,19 +1,85 @@
+import json
+from collections import ChainMap
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+
 import ui
-from session import api_request, _paginate
-from mist import _ORG_RESOURCE_STRIP_FIELDS
+from session import api_request, _paginate, _iter_pages, _post_many, _response_id
+from mist import _strip
 from prompts import prompt_yes_no
 
-
-def _remap_ids_recursive(obj, id_map):
-    if isinstance(obj, dict):
-        return {k: _remap_ids_recursive(v, id_map) for k, v in obj.items()}
-    if isinstance(obj, list):
-        return [_remap_ids_recursive(item, id_map) for item in obj]
-    if isinstance(obj, str) and obj in id_map:
-        return id_map[obj]
+_PSK_EXTRA_STRIP = frozenset({"ui_url"})
+_USERMAC_IMPORT_CHUNK = 100
+# Result value for an entry sent through a bulk import whose response had no per-entry outcome.
+_IMPORT_UNCONFIRMED = object()
+
+
+def _remap_ids_recursive(obj, id_map, memo=None):
+    if not isinstance(obj, (dict, list)):
+        return id_map.get(obj, obj) if isinstance(obj, str) else obj
+    if memo is None:
+        memo = set()
+    stack = [obj]
+    while stack:
+        current = stack.pop()
+        if id(current) in memo:
+            continue
+        memo.add(id(current))
+        entries = current.items() if isinstance(current, dict) else enumerate(current)
+        for key, value in entries:
+            if isinstance(value, str):
+                if value in id_map:
+                    current[key] = id_map[value]
+            elif isinstance(value, (dict, list)):
+                stack.append(value)
     return obj
 
 
+def _payload_strings(obj):
+    strings = set()
+    stack = [obj]
+    while stack:
+        current = stack.pop()
+        for value in (current.values() if isinstance(current, dict) else current):
+            if isinstance(value, str):
+                strings.add(value)
+            elif isinstance(value, (dict, list)):
+                stack.append(value)
+    return strings
+
+
+def _remap_payload(payload, id_map):
+    found = _payload_strings(payload) & id_map.keys()
+    if not found:
+        return payload
+    return _remap_ids_recursive(payload, {k: id_map[k] for k in found})
+
+
+def _fetch_first_page(session, url):
+    pages = _iter_pages(session, url)
+    return next(pages, []), pages
+
+
+def _build_id_map(items, results):
+    return {
+        item["id"]: new_id
+        for item, (new_id, exc) in zip(items, results)
+        if not exc and new_id and item.get("id")
+    }
+
+
+def _stream_items(first_page, more_pages, fetched, label):
+    page = first_page
+    while page:
+        fetched.extend(page)
+        yield from page
+        try:
+            page = next(more_pages, None)
+        except Exception as exc:
+            ui.warn(f"Could not fetch remaining {label}: {exc}")
+            return
+
+
 def clone_nac_sso_roles(source_session, dest_session, source_org_id, dest_org_id,
                         source_base_url, dest_base_url):
     try:
@@ -25,21 +91,16 @@ def clone_nac_sso_roles(source_session, dest_session, source_org_id, dest_org_id
         ui.info("No SSO roles found in source org.")
         return {}
     create_url = f"{dest_base_url}/orgs/{dest_org_id}/ssoroles"
-    id_map = {}
+    payloads = [_strip(item) for item in items]
+    results = _post_many(dest_session, create_url, payloads, parse=_response_id)
     ok = 0
-    for item in items:
-        old_id = item.get("id")
-        payload = {k: v for k, v in item.items() if k not in _ORG_RESOURCE_STRIP_FIELDS}
-        try:
-            resp = api_request(dest_session, "POST", create_url, payload=payload, ok_status=(200, 201))
-            new_id = resp.json().get("id")
-            if old_id and new_id:
-                id_map[old_id] = new_id
-            ok += 1
-        except Exception as exc:
+    for item, (_, exc) in zip(items, results):
+        if exc:
             ui.warn(f"SSO role '{item.get('name')}' skipped: {exc}")
+            continue
+        ok += 1
     ui.ok(f"SSO roles copied: {ok}/{len(items)}")
-    return id_map
+    return _build_id_map(items, results)
 
 
 def clone_nac_ssos(source_session, dest_session, source_org_id, dest_org_id,
@@ -53,47 +114,50 @@ def clone_nac_ssos(source_session, dest_session, source_org_id, dest_org_id,
         ui.info("No SSOs found in source org.")
         return {}
     create_url = f"{dest_base_url}/orgs/{dest_org_id}/ssos"
-    id_map = {}
-    ok = 0
-    names = []
+    payloads = []
     for item in items:
-        old_id = item.get("id")
-        payload = {k: v for k, v in item.items() if k not in _ORG_RESOURCE_STRIP_FIELDS}
+        payload = _strip(item)
         if ssorole_id_map:
-            payload = _remap_ids_recursive(payload, ssorole_id_map)
-        try:
-            resp = api_request(dest_session, "POST", create_url, payload=payload, ok_status=(200, 201))
-            new_id = resp.json().get("id")
-            if old_id and new_id:
-                id_map[old_id] = new_id
-            ok += 1
-            names.append(item.get("name") or old_id or "unknown")
-        except Exception as exc:
+            payload = _remap_payload(payload, ssorole_id_map)
+        payloads.append(payload)
+    results = _post_many(dest_session, create_url, payloads, parse=_response_id)
+    id_map = _build_id_map(items, results)
+    ok = 0
+    names = []
+    for item, (_, exc) in zip(items, results):
+        if exc:
             ui.warn(f"SSO '{item.get('name')}' skipped: {exc}")
+            continue
+        ok += 1
+        names.append(item.get("name") or item.get("id") or "unknown")
     ui.ok(f"SSOs copied: {ok}/{len(items)}")
     if names:
         ui.warn("ACTION REQUIRED — SSO / SAML SP metadata must be reconfigured:")
-        ui.info("  Each SSO generates a unique Service Provider (SP) entity per org.")
-        ui.info("  The SP Entity ID, ACS URL, and signing certificate are different in the")
-        ui.info("  destination org and must be re-registered with your Identity Provider.")
-        ui.info("  For each SSO below, retrieve the new SP metadata and update your IdP:")
-        ui.info("    Mist UI → Organization → Access → SSOs → (select SSO) → Download SP Metadata")
-        for name in names:
-            ui.info(f"    • {name}")
+        ui.info_lines([
+            "  Each SSO generates a unique Service Provider (SP) entity per org.",
+            "  The SP Entity ID, ACS URL, and signing certificate are different in the",
+            "  destination org and must be re-registered with your Identity Provider.",
+            "  For each SSO below, retrieve the new SP metadata and update your IdP:",
+            "    Mist UI → Organization → Access → SSOs → (select SSO) → Download SP Metadata",
+            *(f"    • {name}" for name in names),
+        ])
         ui.warn("ACTION REQUIRED — SSO / IDP Allowable Domains not cloned:")
-        ui.info("  The 'Allowable Domains' list for each SSO / IDP configuration is not")
-        ui.info("  included in the /ssos endpoint payload and must be reconfigured manually")
-        ui.info("  in the destination org for each SSO listed above:")
-        ui.info("    Mist UI → Organization → Access → SSOs → (select SSO) → Allowable Domains")
+        ui.info_lines([
+            "  The 'Allowable Domains' list for each SSO / IDP configuration is not",
+            "  included in the /ssos endpoint payload and must be reconfigured manually",
+            "  in the destination org for each SSO listed above:",
+            "    Mist UI → Organization → Access → SSOs → (select SSO) → Allowable Domains",
+        ])
     return id_map
 
 
 def clone_nac_settings(source_session, dest_session, source_org_id, dest_org_id,
                        source_base_url, dest_base_url):
     try:
-        source_settings = api_request(
+        resp = api_request(
             source_session, "GET", f"{source_base_url}/orgs/{source_org_id}/setting"
-        ).json()
+        )
+        source_settings = json.loads(resp.content) if b'"mist_nac"' in resp.content else {}
     except Exception as exc:
         ui.warn(f"Could not fetch org settings for NAC copy: {exc}")
         return
@@ -108,11 +172,13 @@ def clone_nac_settings(source_session, dest_session, source_org_id, dest_org_id,
         )
         ui.ok("NAC org settings (mist_nac) copied.")
         ui.warn("ACTION REQUIRED — RADIUS shared secrets and IDP credentials:")
-        ui.info("  The mist_nac block (RADIUS servers, IDP config) has been copied to the")
-        ui.info("  destination org. RADIUS shared secrets and IDP credentials are included.")
-        ui.info("  Verify that all secrets are correct for the destination environment:")
-        ui.info("    Mist UI → Organization → Access → Access Assurance → Settings")
-        ui.info("  Update any RADIUS shared secrets that differ between environments.")
+        ui.info_lines([
+            "  The mist_nac block (RADIUS servers, IDP config) has been copied to the",
+            "  destination org. RADIUS shared secrets and IDP credentials are included.",
+            "  Verify that all secrets are correct for the destination environment:",
+            "    Mist UI → Organization → Access → Access Assurance → Settings",
+            "  Update any RADIUS shared secrets that differ between environments.",
+        ])
     except Exception as exc:
         ui.warn(f"Could not copy mist_nac settings: {exc}")
 
@@ -120,9 +186,10 @@ def clone_nac_settings(source_session, dest_session, source_org_id, dest_org_id,
 def clone_nac_scep(source_session, dest_session, source_org_id, dest_org_id,
                    source_base_url, dest_base_url):
     try:
-        scep = api_request(
+        resp = api_request(
             source_session, "GET", f"{source_base_url}/orgs/{source_org_id}/setting/mist_scep"
-        ).json()
+        )
+        scep = json.loads(resp.content)
     except Exception:
         ui.info("SCEP settings not found or not accessible — skipping.")
         return
@@ -132,15 +199,17 @@ def clone_nac_scep(source_session, dest_session, source_org_id, dest_org_id,
     try:
         api_request(
             dest_session, "PUT", f"{dest_base_url}/orgs/{dest_org_id}/setting/mist_scep",
-            payload=scep, ok_status=(200, 201)
+            data=resp.content, ok_status=(200, 201)
         )
         ui.ok("SCEP configuration copied.")
         ui.warn("ACTION REQUIRED — SCEP Certificate Authority (CA):")
-        ui.info("  SCEP config has been copied but the Certificate Authority is org-specific.")
-        ui.info("  A new CA will be generated for the destination org automatically.")
-        ui.info("  Client devices will need to trust the new CA certificate.")
-        ui.info("  Download and distribute the new CA cert from:")
-        ui.info("    Mist UI → Organization → Access → Access Assurance → SCEP → Download CA Cert")
+        ui.info_lines([
+            "  SCEP config has been copied but the Certificate Authority is org-specific.",
+            "  A new CA will be generated for the destination org automatically.",
+            "  Client devices will need to trust the new CA certificate.",
+            "  Download and distribute the new CA cert from:",
+            "    Mist UI → Organization → Access → Access Assurance → SCEP → Download CA Cert",
+        ])
     except Exception as exc:
         ui.warn(f"Could not copy SCEP settings: {exc}")
 
@@ -148,99 +217,105 @@ def clone_nac_scep(source_session, dest_session, source_org_id, dest_org_id,
 def clone_nac_tags(source_session, dest_session, source_org_id, dest_org_id,
                    source_base_url, dest_base_url):
     try:
-        items = _paginate(source_session, f"{source_base_url}/orgs/{source_org_id}/nactags")
+        first_page, more_pages = _fetch_first_page(
+            source_session, f"{source_base_url}/orgs/{source_org_id}/nactags"
+        )
     except Exception as exc:
         ui.warn(f"Could not fetch NAC tags: {exc}")
         return {}
-    if not items:
+    if not first_page:
         ui.info("No NAC tags found in source org.")
         return {}
     create_url = f"{dest_base_url}/orgs/{dest_org_id}/nactags"
-    id_map = {}
+    items = []
+    payloads = (_strip(item) for item in _stream_items(first_page, more_pages, items, "NAC tags"))
+    results = _post_many(dest_session, create_url, payloads, parse=_response_id)
     ok = 0
-    for item in items:
-        old_id = item.get("id")
-        payload = {k: v for k, v in item.items() if k not in _ORG_RESOURCE_STRIP_FIELDS}
-        try:
-            resp = api_request(dest_session, "POST", create_url, payload=payload, ok_status=(200, 201))
-            new_id = resp.json().get("id")
-            if old_id and new_id:
-                id_map[old_id] = new_id
-            ok += 1
-        except Exception as exc:
+    for item, (_, exc) in zip(items, results):
+        if exc:
             ui.warn(f"NAC tag '{item.get('name')}' skipped: {exc}")
+            continue
+        ok += 1
     ui.ok(f"NAC tags copied: {ok}/{len(items)}")
-    return id_map
+    return _build_id_map(items, results)
 
 
 def clone_nac_rules(source_session, dest_session, source_org_id, dest_org_id,
                     nactag_id_map, source_base_url, dest_base_url):
     try:
-        items = _paginate(source_session, f"{source_base_url}/orgs/{source_org_id}/nacrules")
+        first_page, more_pages = _fetch_first_page(
+            source_session, f"{source_base_url}/orgs/{source_org_id}/nacrules"
+        )
     except Exception as exc:
         ui.warn(f"Could not fetch NAC rules: {exc}")
         return
-    if not items:
+    if not first_page:
         ui.info("No NAC rules found in source org.")
         return
     create_url = f"{dest_base_url}/orgs/{dest_org_id}/nacrules"
+    items = []
+    payloads = (
+        _remap_payload(_strip(item), nactag_id_map) if nactag_id_map else _strip(item)
+        for item in _stream_items(first_page, more_pages, items, "NAC rules")
+    )
+    results = _post_many(dest_session, create_url, payloads)
     ok = 0
-    for item in items:
-        payload = {k: v for k, v in item.items() if k not in _ORG_RESOURCE_STRIP_FIELDS}
-        if nactag_id_map:
-            payload = _remap_ids_recursive(payload, nactag_id_map)
-        try:
-            api_request(dest_session, "POST", create_url, payload=payload, ok_status=(200, 201))
-            ok += 1
-        except Exception as exc:
+    for item, (_, exc) in zip(items, results):
+        if exc:
             ui.warn(f"NAC rule '{item.get('name')}' skipped: {exc}")
+            continue
+        ok += 1
     ui.ok(f"NAC rules copied: {ok}/{len(items)}")
 
 
 def clone_nac_portals(source_session, dest_session, source_org_id, dest_org_id,
                       nactag_id_map, sso_id_map, source_base_url, dest_base_url):
     try:
-        items = _paginate(source_session, f"{source_base_url}/orgs/{source_org_id}/nacportals")
+        first_page, more_pages = _fetch_first_page(
+            source_session, f"{source_base_url}/orgs/{source_org_id}/nacportals"
+        )
     except Exception as exc:
         ui.warn(f"Could not fetch NAC portals: {exc}")
         return
-    if not items:
+    if not first_page:
         ui.info("No NAC portals found in source org.")
         return
     create_url = f"{dest_base_url}/orgs/{dest_org_id}/nacportals"
     ok = 0
     names = []
-    combined_id_map = {**nactag_id_map, **sso_id_map}
-    for item in items:
-        payload = {k: v for k, v in item.items() if k not in _ORG_RESOURCE_STRIP_FIELDS}
-        if combined_id_map:
-            payload = _remap_ids_recursive(payload, combined_id_map)
-        try:
-            api_request(dest_session, "POST", create_url, payload=payload, ok_status=(200, 201))
-            ok += 1
-            names.append(item.get("name") or item.get("id") or "unknown")
-        except Exception as exc:
+    combined_id_map = ChainMap(sso_id_map, nactag_id_map)
+    items = []
+    payloads = (
+        _remap_payload(_strip(item), combined_id_map) if combined_id_map else _strip(item)
+        for item in _stream_items(first_page, more_pages, items, "NAC portals")
+    )
+    results = _post_many(dest_session, create_url, payloads)
+    for item, (_, exc) in zip(items, results):
+        if exc:
             ui.warn(f"NAC portal '{item.get('name')}' skipped: {exc}")
+            continue
+        ok += 1
+        names.append(item.get("name") or item.get("id") or "unknown")
     ui.ok(f"NAC portals copied: {ok}/{len(items)}")
     if names:
         ui.warn("ACTION REQUIRED — NAC Portal post-clone steps required:")
-        ui.info("")
-        ui.info("  1. PORTAL BRANDING IMAGES cannot be transferred via the API.")
-        ui.info("     Re-upload any custom logo or background images for each portal:")
-        ui.info("       Mist UI → Organization → Access → NAC Portals → (select portal) → Branding")
-        ui.info("")
-        ui.info("  2. SAML SP METADATA is unique per org — the destination portal has a new")
-        ui.info("     SP Entity ID, ACS URL, and signing certificate.")
-        ui.info("     Retrieve the new SP metadata and update your IdP for each portal below:")
-        ui.info("       Mist UI → Organization → Access → NAC Portals → (select portal) → Download SP Metadata")
-        ui.info("")
-        for name in names:
-            ui.info(f"    • {name}")
+        ui.info_lines([
+            "",
+            "  1. PORTAL BRANDING IMAGES cannot be transferred via the API.",
+            "     Re-upload any custom logo or background images for each portal:",
+            "       Mist UI → Organization → Access → NAC Portals → (select portal) → Branding",
+            "",
+            "  2. SAML SP METADATA is unique per org — the destination portal has a new",
+            "     SP Entity ID, ACS URL, and signing certificate.",
+            "     Retrieve the new SP metadata and update your IdP for each portal below:",
+            "       Mist UI → Organization → Access → NAC Portals → (select portal) → Download SP Metadata",
+            "",
+            *(f"    • {name}" for name in names),
+        ])
 
 
 def clone_psk_portals(source_session, dest_session, source_org_id, dest_org_id,
                       source_base_url, dest_base_url):
-    _PSK_EXTRA_STRIP = {"ui_url"}
     try:
         items = _paginate(source_session, f"{source_base_url}/orgs/{source_org_id}/pskportals")
     except Exception as exc:
@@ -254,44 +329,87 @@ def clone_psk_portals(source_session, dest_session, source_org_id, dest_org_id,
     names = []
     sso_names = []
     image_names = []
-    for item in items:
-        payload = {
-            k: v for k, v in item.items()
-            if k not in _ORG_RESOURCE_STRIP_FIELDS and k not in _PSK_EXTRA_STRIP
-        }
+    payloads = [_strip(item, _PSK_EXTRA_STRIP) for item in items]
+    for item, (_, exc) in zip(items, _post_many(dest_session, create_url, payloads)):
         portal_name = item.get("name") or item.get("id") or "unknown"
-        try:
-            api_request(dest_session, "POST", create_url, payload=payload, ok_status=(200, 201))
-            ok_count += 1
-            names.append(portal_name)
-            if item.get("auth") == "sso" or item.get("sso"):
-                sso_names.append(portal_name)
-            if any(item.get(f) for f in ("bg_image_url", "thumbnail_url", "template_url")):
-                image_names.append(portal_name)
-        except Exception as exc:
+        if exc:
             ui.warn(f"PSK portal '{portal_name}' skipped: {exc}")
+            continue
+        ok_count += 1
+        names.append(portal_name)
+        if item.get("auth") == "sso" or item.get("sso"):
+            sso_names.append(portal_name)
+        if any(item.get(f) for f in ("bg_image_url", "thumbnail_url", "template_url")):
+            image_names.append(portal_name)
     ui.ok(f"PSK portals copied: {ok_count}/{len(items)}")
     if sso_names:
         ui.warn("ACTION REQUIRED \u2014 PSK Portal SSO / SAML SP metadata must be reconfigured:")
-        ui.info("  Each PSK portal with SSO auth generates a unique SP Entity ID and ACS URL.")
-        ui.info("  Retrieve the new SP metadata for each portal below and re-register with your IdP:")
-        ui.info("    Mist UI \u2192 Organization \u2192 Access \u2192 PSK Portals \u2192 (select portal) \u2192 Download SP Metadata")
-        for name in sso_names:
-            ui.info(f"    \u2022 {name}")
+        ui.info_lines([
+            "  Each PSK portal with SSO auth generates a unique SP Entity ID and ACS URL.",
+            "  Retrieve the new SP metadata for each portal below and re-register with your IdP:",
+            "    Mist UI \u2192 Organization \u2192 Access \u2192 PSK Portals \u2192 (select portal) \u2192 Download SP Metadata",
+            *(f"    \u2022 {name}" for name in sso_names),
+        ])
     if image_names:
         ui.warn("ACTION REQUIRED \u2014 PSK Portal branding images must be re-uploaded:")
-        ui.info("  Background images, thumbnails, and custom templates are binary uploads")
-        ui.info("  that cannot be transferred via the API. Re-upload them for each portal below:")
-        ui.info("    Mist UI \u2192 Organization \u2192 Access \u2192 PSK Portals \u2192 (select portal) \u2192 Branding")
-        for name in image_names:
-            ui.info(f"    \u2022 {name}")
+        ui.info_lines([
+            "  Background images, thumbnails, and custom templates are binary uploads",
+            "  that cannot be transferred via the API. Re-upload them for each portal below:",
+            "    Mist UI \u2192 Organization \u2192 Access \u2192 PSK Portals \u2192 (select portal) \u2192 Branding",
+            *(f"    \u2022 {name}" for name in image_names),
+        ])
 
 
 def clone_nac_crl_notice():
     ui.warn("ACTION REQUIRED — Certificate Revocation Lists (CRLs):")
-    ui.info("  CRL files are uploaded binary files and cannot be transferred automatically.")
-    ui.info("  If the source org has CRLs configured, re-upload them to the destination org:")
-    ui.info("    Mist UI → Organization → Access → Access Assurance → Certificates → Upload CRL")
+    ui.info_lines([
+        "  CRL files are uploaded binary files and cannot be transferred automatically.",
+        "  If the source org has CRLs configured, re-upload them to the destination org:",
+        "    Mist UI → Organization → Access → Access Assurance → Certificates → Upload CRL",
+    ])
+
+
+def _usermac_key(entry):
+    mac = entry.get("mac") if isinstance(entry, dict) else entry
+    return str(mac or "").lower()
+
+
+def _import_user_macs(dest_session, create_url, chunk):
+    response = api_request(dest_session, "POST", f"{create_url}/import", payload=chunk, ok_status=(200, 201))
+    try:
+        body = response.json()
+    except ValueError:
+        body = None
+    if not isinstance(body, dict) or not any(key in body for key in ("added", "updated", "errors")):
+        return [(_IMPORT_UNCONFIRMED, None)] * len(chunk)
+    accepted = {_usermac_key(m) for key in ("added", "updated") for m in body.get(key) or ()}
+    errors = [str(e) for e in body.get("errors") or ()]
+    results = []
+    for entry in chunk:
+        mac = _usermac_key(entry)
+        if mac in accepted:
+            results.append((None, None))
+            continue
+        detail = next((e for e in errors if mac and mac in e.lower()), "not added by the bulk import")
+        results.append((None, Exception(detail)))
+    return results
+
+
+def _create_user_macs(dest_session, create_url, payloads):
+    results = []
+    use_import = True
+    payloads = iter(payloads)
+    while True:
+        chunk = list(islice(payloads, _USERMAC_IMPORT_CHUNK))
+        if not chunk:
+            return results
+        if use_import:
+            try:
+                results.extend(_import_user_macs(dest_session, create_url, chunk))
+                continue
+            except Exception:
+                use_import = False
+        results.extend(_post_many(dest_session, create_url, chunk))
 
 
 def clone_user_macs(source_session, dest_session, source_org_id, dest_org_id,
@@ -300,77 +418,87 @@ def clone_user_macs(source_session, dest_session, source_org_id, dest_org_id,
         ui.info("User MAC entries skipped.")
         return
     try:
-        items = _paginate(source_session, f"{source_base_url}/orgs/{source_org_id}/usermacs")
+        first_page, more_pages = _fetch_first_page(
+            source_session, f"{source_base_url}/orgs/{source_org_id}/usermacs"
+        )
     except Exception as exc:
         ui.warn(f"Could not fetch User MACs: {exc}")
         return
-    if not items:
+    if not first_page:
         ui.info("No User MAC entries found in source org.")
         return
     create_url = f"{dest_base_url}/orgs/{dest_org_id}/usermacs"
+    items = []
+    payloads = (_strip(item) for item in _stream_items(first_page, more_pages, items, "User MACs"))
+    results = _create_user_macs(dest_session, create_url, payloads)
     ok = 0
-    for item in items:
-        payload = {k: v for k, v in item.items() if k not in _ORG_RESOURCE_STRIP_FIELDS}
-        try:
-            api_request(dest_session, "POST", create_url, payload=payload, ok_status=(200, 201))
-            ok += 1
-        except Exception as exc:
+    unconfirmed = 0
+    for item, (value, exc) in zip(items, results):
+        if exc:
             ui.warn(f"User MAC '{item.get('mac')}' skipped: {exc}")
-    ui.ok(f"User MAC entries copied: {ok}/{len(items)}")
-
-
-def clone_nac(source_session, dest_session, source_org_id, dest_org_id,
-              source_base_url, dest_base_url):
-    ui.progress("Copying NAC org settings …")
-    clone_nac_settings(
-        source_session, dest_session, source_org_id, dest_org_id,
-        source_base_url=source_base_url, dest_base_url=dest_base_url,
-    )
-
-    ui.progress("Copying SCEP configuration …")
-    clone_nac_scep(
-        source_session, dest_session, source_org_id, dest_org_id,
-        source_base_url=source_base_url, dest_base_url=dest_base_url,
-    )
+        elif value is _IMPORT_UNCONFIRMED:
+            unconfirmed += 1
+        else:
+            ok += 1
+    if unconfirmed:
+        ui.ok(f"User MAC entries submitted: {ok + unconfirmed}/{len(items)} "
+              f"({unconfirmed} via bulk import, which reported no per-entry results)")
+    else:
+        ui.ok(f"User MAC entries copied: {ok}/{len(items)}")
 
-    ui.progress("Copying SSO roles …")
-    ssorole_id_map = clone_nac_sso_roles(
-        source_session, dest_session, source_org_id, dest_org_id,
-        source_base_url=source_base_url, dest_base_url=dest_base_url,
-    )
 
-    ui.progress("Copying SSOs …")
-    sso_id_map = clone_nac_ssos(
-        source_session, dest_session, source_org_id, dest_org_id,
-        ssorole_id_map,
-        source_base_url=source_base_url, dest_base_url=dest_base_url,
-    )
+def _run_deferred(progress_msg, fn, *args, **kwargs):
+    with ui.deferred() as events:
+        ui.progress(progress_msg)
+        result = fn(*args, **kwargs)
+    return result, events
 
-    ui.progress("Copying NAC tags …")
-    nactag_id_map = clone_nac_tags(
-        source_session, dest_session, source_org_id, dest_org_id,
-        source_base_url=source_base_url, dest_base_url=dest_base_url,
-    )
 
-    ui.progress("Copying NAC rules …")
-    clone_nac_rules(
-        source_session, dest_session, source_org_id, dest_org_id,
-        nactag_id_map,
-        source_base_url=source_base_url, dest_base_url=dest_base_url,
-    )
+def clone_nac(source_session, dest_session, source_org_id, dest_org_id,
+              source_base_url, dest_base_url):
+    clone_args = (source_session, dest_session, source_org_id, dest_org_id)
+    urls = {"source_base_url": source_base_url, "dest_base_url": dest_base_url}
+
+    # Both PUTs write the destination's org settings document, so they must not overlap.
+    def _settings_then_scep():
+        _, events = _run_deferred("Copying NAC org settings …", clone_nac_settings, *clone_args, **urls)
+        _, scep_events = _run_deferred("Copying SCEP configuration …", clone_nac_scep, *clone_args, **urls)
+        return None, events + scep_events
+
+    def _roles_then_ssos():
+        ssorole_id_map, events = _run_deferred("Copying SSO roles …", clone_nac_sso_roles, *clone_args, **urls)
+        sso_id_map, sso_events = _run_deferred(
+            "Copying SSOs …", clone_nac_ssos, *clone_args, ssorole_id_map, **urls
+        )
+        return sso_id_map, events + sso_events
 
-    ui.progress("Copying NAC portals …")
-    clone_nac_portals(
-        source_session, dest_session, source_org_id, dest_org_id,
-        nactag_id_map, sso_id_map,
-        source_base_url=source_base_url, dest_base_url=dest_base_url,
-    )
+    def _tags_then_rules():
+        nactag_id_map, events = _run_deferred("Copying NAC tags …", clone_nac_tags, *clone_args, **urls)
+        _, rule_events = _run_deferred(
+            "Copying NAC rules …", clone_nac_rules, *clone_args, nactag_id_map, **urls
+        )
+        return nactag_id_map, events + rule_events
+
+    with ThreadPoolExecutor(max_workers=4) as ex:
+        f_settings = ex.submit(_settings_then_scep)
+        f_ssos = ex.submit(_roles_then_ssos)
+        f_tags = ex.submit(_tags_then_rules)
+        f_psk = ex.submit(_run_deferred, "Copying PSK portals …", clone_psk_portals, *clone_args, **urls)
+
+        ui.replay(f_settings.result()[1])
+        sso_id_map, events = f_ssos.result()
+        ui.replay(events)
+        nactag_id_map, events = f_tags.result()
+        ui.replay(events)
+
+        ui.progress("Copying NAC portals …")
+        clone_nac_portals(
+            source_session, dest_session, source_org_id, dest_org_id,
+            nactag_id_map, sso_id_map,
+            source_base_url=source_base_url, dest_base_url=dest_base_url,
+        )
 
-    ui.progress("Copying PSK portals …")
-    clone_psk_portals(
-        source_session, dest_session, source_org_id, dest_org_id,
-        source_base_url=source_base_url, dest_base_url=dest_base_url,
-    )
+        ui.replay(f_psk.result()[1])
 
     clone_nac_crl_notice()
 
@@ -1,6 +1,6 @@
 import ui
 from session import api_request, _paginate
-from mist import _ORG_RESOURCE_STRIP_FIELDS
+from mist import _strip
 
 
 def parse_superuser_details(raw_details):
@@ -67,9 +67,10 @@ def fetch_alarm_templates(session, org_id, base_url):
 
 
 def clone_alarm_templates(source_session, dest_session, source_org_id, new_org_id,
-                          source_base_url, dest_base_url):
+                          source_base_url, dest_base_url, _cached_alarm_templates=None):
     ui.progress("Copying alarm templates …")
-    source_templates = fetch_alarm_templates(source_session, source_org_id, base_url=source_base_url)
+    source_templates = _cached_alarm_templates if _cached_alarm_templates is not None \
+        else fetch_alarm_templates(source_session, source_org_id, base_url=source_base_url)
     if not source_templates:
         ui.info("No alarm templates found in source org.")
         return 0
@@ -85,7 +86,7 @@ def clone_alarm_templates(source_session, dest_session, source_org_id, new_org_i
         if name in existing_names:
             already += 1
             continue
-        payload = {k: v for k, v in template.items() if k not in _ORG_RESOURCE_STRIP_FIELDS}
+        payload = _strip(template)
         try:
             api_request(dest_session, "POST", create_url, payload=payload, ok_status=(200, 201))
             ok += 1
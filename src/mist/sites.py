@@ -2,7 +2,8 @@ import requests
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import ui
-from session import api_request, _paginate, DEFAULT_TIMEOUT
+from session import (api_request, api_get_json, _paginate, DEFAULT_TIMEOUT,
+                     MAP_IMAGE_WORKERS, SITE_PREFETCH_WORKERS)
 
 _SITE_SETTINGS_STRIP_FIELDS = {
     "id", "org_id", "site_id", "for_site", "created_time", "modified_time",
@@ -13,11 +14,24 @@ _SITE_WLAN_STRIP_FIELDS = {"id", "org_id", "site_id", "created_time", "modified_
 
 _SITE_MAP_STRIP_FIELDS = {"id", "org_id", "site_id", "created_time", "modified_time", "url", "thumbnail_url"}
 
+_SOURCE_SITE_DETAILS_CACHE = {}
+
 
 def get_site_details(session, site_id, base_url):
-    url = f"{base_url}/sites/{site_id}"
-    response = api_request(session, "GET", url)
-    return response.json()
+    return api_get_json(session, f"{base_url}/sites/{site_id}")
+
+
+def get_source_site_details(session, site_id, base_url):
+    key = (base_url, site_id)
+    details = _SOURCE_SITE_DETAILS_CACHE.get(key)
+    if details is None:
+        details = get_site_details(session, site_id, base_url)
+        _SOURCE_SITE_DETAILS_CACHE[key] = details
+    return details
+
+
+def clear_source_site_details_cache():
+    _SOURCE_SITE_DETAILS_CACHE.clear()
 
 
 def create_site(session, org_id, site_name, site_address, country_code, base_url, timezone=None):
@@ -30,9 +44,7 @@ def create_site(session, org_id, site_name, site_address, country_code, base_url
 
 
 def get_site_settings(session, site_id, base_url):
-    url = f'{base_url}/sites/{site_id}/setting'
-    response = api_request(session, "GET", url)
-    return response.json()
+    return api_get_json(session, f'{base_url}/sites/{site_id}/setting')
 
 
 def copy_site_settings(session, source_site_id, target_site_id,
@@ -46,10 +58,13 @@ def copy_site_settings(session, source_site_id, target_site_id,
     api_request(_dst_sess, "PUT", url, payload=cleaned)
 
 
+def _list_site_wlans(session, site_id, base_url):
+    return _paginate(session, f'{base_url}/sites/{site_id}/wlans')
+
+
 def fetch_site_wlans(session, site_id, base_url):
-    url = f'{base_url}/sites/{site_id}/wlans'
     try:
-        return _paginate(session, url)
+        return _list_site_wlans(session, site_id, base_url)
     except Exception as exc:
         ui.warn(f"Could not fetch site WLANs for site {site_id}: {exc}")
         return []
@@ -74,10 +89,13 @@ def clone_site_wlans(source_session, dest_session, source_site_id, dest_site_id,
     return ok
 
 
+def _list_site_maps(session, site_id, base_url):
+    return _paginate(session, f'{base_url}/sites/{site_id}/maps')
+
+
 def fetch_site_maps(session, site_id, base_url):
-    url = f'{base_url}/sites/{site_id}/maps'
     try:
-        return _paginate(session, url)
+        return _list_site_maps(session, site_id, base_url)
     except Exception as exc:
         ui.warn(f"Could not fetch site maps for site {site_id}: {exc}")
         return []
@@ -94,12 +112,13 @@ def clone_site_maps(source_session, dest_session, source_site_id, dest_site_id,
 
     create_url = f'{dest_base_url}/sites/{dest_site_id}/maps'
 
+    # Runs on the image pool's threads, outside any ui.deferred() block, so it returns
+    # its warning for the caller to report instead of printing it.
     def _upload_image(map_name, new_map_id, source_image_url):
         try:
             img_resp = requests.get(source_image_url, timeout=DEFAULT_TIMEOUT)
             if img_resp.status_code != 200:
-                ui.warn(f"Could not download map image for '{map_name}': HTTP {img_resp.status_code}")
-                return
+                return f"Could not download map image for '{map_name}': HTTP {img_resp.status_code}"
             content_type = img_resp.headers.get("Content-Type", "application/octet-stream")
             filename = source_image_url.split("/")[-1].split("?")[0] or "map_image"
             upload_url = f'{dest_base_url}/sites/{dest_site_id}/maps/{new_map_id}/image'
@@ -110,9 +129,10 @@ def clone_site_maps(source_session, dest_session, source_site_id, dest_site_id,
                 timeout=DEFAULT_TIMEOUT,
             )
             if up_resp.status_code not in (200, 201):
-                ui.warn(f"Map image upload failed for '{map_name}': {up_resp.text[:200]}")
+                return f"Map image upload failed for '{map_name}': {up_resp.text[:200]}"
         except Exception as exc:
-            ui.warn(f"Map image upload skipped for '{map_name}': {exc}")
+            return f"Map image upload skipped for '{map_name}': {exc}"
+        return None
 
     image_tasks = []
     ok = 0
@@ -131,26 +151,32 @@ def clone_site_maps(source_session, dest_session, source_site_id, dest_site_id,
         ok += 1
 
     if image_tasks:
-        with ThreadPoolExecutor(max_workers=min(len(image_tasks), 8)) as ex:
-            list(ex.map(lambda t: _upload_image(*t), image_tasks))
+        with ThreadPoolExecutor(max_workers=min(len(image_tasks), MAP_IMAGE_WORKERS)) as ex:
+            image_warnings = list(ex.map(lambda t: _upload_image(*t), image_tasks))
+        for warning in image_warnings:
+            if warning:
+                ui.warn(warning)
 
     return ok
 
 
 def _prefetch_source_site_data(source_session, site_id, source_base_url):
+    # The fetches raise rather than warn: ui.deferred() only covers the calling thread,
+    # so failures are reported from the loop below instead of from the pool threads.
     results = {}
-    with ThreadPoolExecutor(max_workers=4) as pool:
+    with ThreadPoolExecutor(max_workers=SITE_PREFETCH_WORKERS) as pool:
         futs = {
             pool.submit(get_site_settings, source_session, site_id, source_base_url): "settings",
-            pool.submit(fetch_site_wlans,  source_session, site_id, source_base_url): "wlans",
-            pool.submit(fetch_site_maps,   source_session, site_id, source_base_url): "maps",
-            pool.submit(get_site_details,  source_session, site_id, source_base_url): "details",
+            pool.submit(_list_site_wlans,  source_session, site_id, source_base_url): "wlans",
+            pool.submit(_list_site_maps,   source_session, site_id, source_base_url): "maps",
+            pool.submit(get_source_site_details, source_session, site_id, source_base_url): "details",
         }
         for fut in as_completed(futs):
             key = futs[fut]
             try:
                 results[key] = fut.result()
             except Exception as exc:
-                results[key] = None
+                # An empty list matches what fetch_site_wlans/fetch_site_maps return on failure.
+                results[key] = [] if key in ("wlans", "maps") else None
                 ui.warn(f"Pre-fetch '{key}' failed for source site {site_id}: {exc}")
     return results
@@ -1,20 +1,78 @@
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import ui
-from session import api_request, _paginate
+from session import api_request, _paginate, POST_WORKERS
 from prompts import prompt_input, select_name_from_list
 
+_NON_WLAN_SITE_FIELDS = {
+    "switch_template_id":   "networktemplate_id",
+    "wan_edge_template_id": "gatewaytemplate_id",
+    "rftemplate_id":        "rftemplate_id",
+}
+
+_NON_WLAN_KEY_LABELS = {key: key.replace("_", " ").title() for key in _NON_WLAN_SITE_FIELDS}
+
+_TEMPLATE_ENDPOINTS = {
+    "switch":   "networktemplates",
+    "wan_edge": "gatewaytemplates",
+    "wlan":     "templates",
+    "rf":       "rftemplates",
+}
+
+_ASSIGNMENT_LABELS = {
+    "switch_template_id":   "switch",
+    "wan_edge_template_id": "wan edge",
+    "wlan_template_id":     "wlan (site)",
+    "wlan_org_template_id": "wlan (org)",
+    "rftemplate_id":        "rf",
+}
+
+_ASSIGNMENT_NAME_KEYS = {
+    "switch_template_id":   "switch_template_id",
+    "wan_edge_template_id": "wan_edge_template_id",
+    "wlan_template_id":     "wlan_template_id",
+    "wlan_org_template_id": "wlan_template_id",
+    "rftemplate_id":        "rftemplate_id",
+}
+
+_SOURCE_TO_ASSIGNMENT_KEYS = {
+    "switch":   "switch_template_id",
+    "wan_edge": "wan_edge_template_id",
+    "wlan":     "wlan_template_id",
+    "wlan_org": "wlan_org_template_id",
+    "rf":       "rftemplate_id",
+}
+
+_TEMPLATE_CHOICE_LABELS = {
+    "switch":   "switch templates",
+    "wan_edge": "wan edge templates",
+    "wlan":     "wlan templates",
+    "rf":       "rf templates",
+}
+
+_TEMPLATE_LIST_CACHE = {}
+
+
+def fetch_template_list(session, org_id, endpoint, base_url):
+    key = (base_url, org_id, endpoint)
+    items = _TEMPLATE_LIST_CACHE.get(key)
+    if items is None:
+        items = _paginate(session, f"{base_url}/orgs/{org_id}/{endpoint}")
+        _TEMPLATE_LIST_CACHE[key] = items
+    return items
+
+
+def clear_template_list_cache():
+    _TEMPLATE_LIST_CACHE.clear()
+
 
 def fetch_templates(session, org_id, base_url):
-    endpoints = {
-        "switch":   f"{base_url}/orgs/{org_id}/networktemplates",
-        "wan_edge": f"{base_url}/orgs/{org_id}/gatewaytemplates",
-        "wlan":     f"{base_url}/orgs/{org_id}/templates",
-        "rf":       f"{base_url}/orgs/{org_id}/rftemplates",
-    }
     templates = {}
-    with ThreadPoolExecutor(max_workers=4) as ex:
-        futures = {ex.submit(_paginate, session, url): key for key, url in endpoints.items()}
+    with ThreadPoolExecutor(max_workers=len(_TEMPLATE_ENDPOINTS)) as ex:
+        futures = {
+            ex.submit(fetch_template_list, session, org_id, endpoint, base_url): key
+            for key, endpoint in _TEMPLATE_ENDPOINTS.items()
+        }
         for future in as_completed(futures):
             templates[futures[future]] = future.result()
     return templates
@@ -38,7 +96,6 @@ def build_template_maps(session, source_org_id, new_org_id,
 
 
 def build_wlan_scope_info(session, org_id, base_url):
-    url = f'{base_url}/orgs/{org_id}/templates'
     site_map: dict = {}
     org_level_ids: set = set()
 
@@ -48,7 +105,7 @@ def build_wlan_scope_info(session, org_id, base_url):
             if tid not in site_map[sid]:
                 site_map[sid].append(tid)
 
-    for template in _paginate(session, url):
+    for template in fetch_template_list(session, org_id, "templates", base_url):
         template_id = template.get("id")
         if not template_id:
             continue
@@ -67,7 +124,7 @@ def build_wlan_scope_info(session, org_id, base_url):
         else:
             _add_site(template.get("site_id"), template_id)
 
-    return site_map, org_level_ids
+    return site_map, frozenset(org_level_ids)
 
 
 def build_wlan_site_template_map(session, org_id, base_url):
@@ -101,29 +158,15 @@ def build_new_template_id_map(new_templates):
 
 
 def format_assigned_template_names(template_ids, id_name_map):
-    _name_key = {
-        "switch_template_id":   "switch_template_id",
-        "wan_edge_template_id": "wan_edge_template_id",
-        "wlan_template_id":     "wlan_template_id",
-        "wlan_org_template_id": "wlan_template_id",
-        "rftemplate_id":        "rftemplate_id",
-    }
-    labels = {
-        "switch_template_id":   "switch",
-        "wan_edge_template_id": "wan edge",
-        "wlan_template_id":     "wlan (site)",
-        "wlan_org_template_id": "wlan (org)",
-        "rftemplate_id":        "rf",
-    }
     parts = []
-    for key, label in labels.items():
+    for key, label in _ASSIGNMENT_LABELS.items():
         template_id = template_ids.get(key)
         if not template_id:
             if key == "wlan_org_template_id":
                 continue
             parts.append(f"{label}=<none>")
             continue
-        nk = _name_key[key]
+        nk = _ASSIGNMENT_NAME_KEYS[key]
         if isinstance(template_id, list):
             names = [id_name_map.get(nk, {}).get(item, item) for item in template_id]
             parts.append(f"{label}={'|'.join(names)}")
@@ -134,31 +177,17 @@ def format_assigned_template_names(template_ids, id_name_map):
 
 
 def format_template_skip_warnings(skip_reasons):
-    labels = {
-        "switch_template_id":   "switch",
-        "wan_edge_template_id": "wan edge",
-        "wlan_template_id":     "wlan (site)",
-        "wlan_org_template_id": "wlan (org)",
-        "rftemplate_id":        "rf",
-    }
     parts = []
-    for key in labels:
+    for key, label in _ASSIGNMENT_LABELS.items():
         reason = skip_reasons.get(key)
         if reason:
-            parts.append(f"{labels[key]}=skipped ({reason})")
+            parts.append(f"{label}=skipped ({reason})")
     return ", ".join(parts)
 
 
 def compute_mode4_skip_reasons(source_template_ids, resolved_template_ids, source_maps):
     skip_reasons = {}
-    source_to_assignment_keys = {
-        "switch":   "switch_template_id",
-        "wan_edge": "wan_edge_template_id",
-        "wlan":     "wlan_template_id",
-        "wlan_org": "wlan_org_template_id",
-        "rf":       "rftemplate_id",
-    }
-    for source_key, assignment_key in source_to_assignment_keys.items():
+    for source_key, assignment_key in _SOURCE_TO_ASSIGNMENT_KEYS.items():
         source_id = source_template_ids.get(source_key)
         if not source_id:
             continue
@@ -211,13 +240,14 @@ def derive_source_site_template_ids(site_details, site_id=None,
 
 def resolve_template_ids_from_source(site_details, source_maps, new_maps,
                                      site_id=None, wlan_site_map=None,
-                                     wlan_org_level_ids=None):
-    source_ids = derive_source_site_template_ids(
-        site_details,
-        site_id=site_id,
-        wlan_site_map=wlan_site_map,
-        wlan_org_level_ids=wlan_org_level_ids,
-    )
+                                     wlan_org_level_ids=None, source_ids=None):
+    if source_ids is None:
+        source_ids = derive_source_site_template_ids(
+            site_details,
+            site_id=site_id,
+            wlan_site_map=wlan_site_map,
+            wlan_org_level_ids=wlan_org_level_ids,
+        )
     resolved = {}
 
     for key, source_id in source_ids.items():
@@ -270,14 +300,8 @@ def prompt_template_assignment_mode():
 
 def prompt_template_choices_for_org(templates, label_prefix=""):
     choices = {}
-    label_map = {
-        "switch": "switch templates",
-        "wan_edge": "wan edge templates",
-        "wlan": "wlan templates",
-        "rf": "rf templates"
-    }
     for key, items in templates.items():
-        label = label_map[key]
+        label = _TEMPLATE_CHOICE_LABELS[key]
         if label_prefix:
             label = f"{label_prefix} {label}"
         choice = select_name_from_list(items, label)
@@ -286,18 +310,33 @@ def prompt_template_choices_for_org(templates, label_prefix=""):
     return choices
 
 
-def assign_templates(session, org_id, site_id, template_ids, base_url):
-    non_wlan = {
-        "switch_template_id":   {"networktemplate_id": template_ids.get("switch_template_id")},
-        "wan_edge_template_id": {"gatewaytemplate_id": template_ids.get("wan_edge_template_id")},
-        "rftemplate_id":        {"rftemplate_id":       template_ids.get("rftemplate_id")},
-    }
-    for key, payload in non_wlan.items():
-        if not template_ids.get(key):
+def resolve_template_choices(choices, new_maps, wlan_org_ids):
+    template_ids = {}
+    for key, name in choices.items():
+        new_id = new_maps.get(key, {}).get(name)
+        if not new_id:
             continue
-        url = f'{base_url}/sites/{site_id}'
+        if key == "wlan" and new_id in wlan_org_ids:
+            template_ids["wlan_org"] = new_id
+        else:
+            template_ids[key] = new_id
+    return template_ids
+
+
+def assign_templates(session, org_id, site_id, template_ids, base_url, extra_fields=None):
+    url = f'{base_url}/sites/{site_id}'
+    payload = dict(extra_fields or {})
+    assigned = []
+    for key, field in _NON_WLAN_SITE_FIELDS.items():
+        template_id = template_ids.get(key)
+        if not template_id:
+            continue
+        payload[field] = template_id
+        assigned.append(_NON_WLAN_KEY_LABELS[key])
+    if payload:
         api_request(session, "PUT", url, payload=payload)
-        ui.ok(f"{key.replace('_', ' ').title()} assigned.")
+    # No per-site line here; run_clone_flow reports one total across all sites.
+    return assigned
 
 
 def finalize_wlan_assignments(session, new_org_id, site_level_map, org_level_ids,
@@ -307,16 +346,23 @@ def finalize_wlan_assignments(session, new_org_id, site_level_map, org_level_ids
 
     ui.section("WLAN Template Assignment")
 
-    for wlan_id, new_site_ids in site_level_map.items():
-        name = id_name_map.get("wlan_template_id", {}).get(wlan_id, wlan_id)
-        url = f'{base_url}/orgs/{new_org_id}/templates/{wlan_id}'
-        payload = {"applies": {"site_ids": new_site_ids}}
-        api_request(session, "PUT", url, payload=payload)
-        ui.ok(f"WLAN (site-level) '{name}'  →  {len(new_site_ids)} site(s): {new_site_ids}")
+    wlan_names = id_name_map.get("wlan_template_id", {})
+    # One PUT per template: site-level templates carry every site id in a single applies list.
+    jobs = [
+        (wlan_id, {"site_ids": new_site_ids}, f"{len(new_site_ids)} site(s)")
+        for wlan_id, new_site_ids in site_level_map.items()
+    ]
+    jobs.extend((wlan_id, {"org_id": new_org_id}, "all sites") for wlan_id in org_level_ids)
 
-    for wlan_id in org_level_ids:
-        name = id_name_map.get("wlan_template_id", {}).get(wlan_id, wlan_id)
+    def _put_applies(wlan_id, applies):
         url = f'{base_url}/orgs/{new_org_id}/templates/{wlan_id}'
-        payload = {"applies": {"org_id": new_org_id}}
-        api_request(session, "PUT", url, payload=payload)
-        ui.ok(f"WLAN (org-level)  '{name}'  →  applies to all sites in new org.")
+        api_request(session, "PUT", url, payload={"applies": applies})
+
+    with ThreadPoolExecutor(max_workers=min(len(jobs), POST_WORKERS)) as ex:
+        futures = [ex.submit(_put_applies, wlan_id, applies) for wlan_id, applies, _ in jobs]
+    for future in futures:
+        future.result()
+    assigned = [f"'{wlan_names.get(wlan_id, wlan_id)}' → {scope}" for wlan_id, _, scope in jobs]
+
+    ui.ok(f"WLAN templates assigned: {len(site_level_map)} site-level, {len(org_level_ids)} org-level.")
+    ui.info(", ".join(assigned))
@@ -3,10 +3,10 @@ from datetime import datetime
 
 import ui
 from session import _paginate
-from mist.sites import get_site_settings, get_site_details
-from mist.sitegroups import fetch_sitegroups
+from mist.sites import get_site_settings, get_source_site_details, clear_source_site_details_cache
+from mist.sitegroups import fetch_sitegroups, build_sitegroup_id_to_name
 from mist.templates import (
-    build_template_maps, build_wlan_scope_info,
+    build_template_maps, build_wlan_scope_info, fetch_template_list, clear_template_list_cache,
     derive_source_site_template_ids, resolve_template_ids_from_source,
     compute_mode4_skip_reasons, format_template_skip_warnings,
 )
@@ -20,21 +20,28 @@ def build_preflight_report(session, source_org_id, source_site_id, template_name
                            cfg, source_base_url):
     site_plans = cfg.site_plans
     template_assignment_mode = cfg.template_assignment_mode
+    clear_template_list_cache()
+    clear_source_site_details_cache()
 
     _fetch_tasks = {
         "settings":           lambda: get_site_settings(session, source_site_id, base_url=source_base_url),
-        "switch_templates":   lambda: _paginate(session, f'{source_base_url}/orgs/{source_org_id}/networktemplates'),
-        "wan_edge_templates": lambda: _paginate(session, f'{source_base_url}/orgs/{source_org_id}/gatewaytemplates'),
-        "wlan_templates":     lambda: _paginate(session, f'{source_base_url}/orgs/{source_org_id}/templates'),
-        "rf_templates":       lambda: _paginate(session, f'{source_base_url}/orgs/{source_org_id}/rftemplates'),
+        "switch_templates":   lambda: fetch_template_list(session, source_org_id, "networktemplates", source_base_url),
+        "wan_edge_templates": lambda: fetch_template_list(session, source_org_id, "gatewaytemplates", source_base_url),
+        "wlan_templates":     lambda: fetch_template_list(session, source_org_id, "templates", source_base_url),
+        "rf_templates":       lambda: fetch_template_list(session, source_org_id, "rftemplates", source_base_url),
         "service_policies":   lambda: _paginate(session, f'{source_base_url}/orgs/{source_org_id}/servicepolicies'),
         "sitegroups":         lambda: fetch_sitegroups(session, source_org_id, base_url=source_base_url),
     }
+    site_plan_ids = [sp.get("source_site_id") for sp in site_plans if sp.get("source_site_id")]
     _results: dict = {}
-    with ThreadPoolExecutor(max_workers=len(_fetch_tasks)) as _ex:
-        _futures = {_ex.submit(fn): key for key, fn in _fetch_tasks.items()}
+    site_details_map: dict = {}
+    with ThreadPoolExecutor(max_workers=min(len(_fetch_tasks) + len(site_plan_ids), 16)) as _ex:
+        _futures = {_ex.submit(fn): (_results, key) for key, fn in _fetch_tasks.items()}
+        for sid in site_plan_ids:
+            _futures[_ex.submit(get_source_site_details, session, sid, source_base_url)] = (site_details_map, sid)
         for _future in as_completed(_futures):
-            _results[_futures[_future]] = _future.result()
+            target, key = _futures[_future]
+            target[key] = _future.result()
 
     site_settings = _results["settings"]
     settings_keys = sorted(site_settings.keys())
@@ -48,18 +55,7 @@ def build_preflight_report(session, source_org_id, source_site_id, template_name
         {"id": i.get("id"), "name": i.get("name")} for i in _results["service_policies"]
     ]
     source_sitegroups_preflight = _results["sitegroups"]
-    source_sg_id_to_name = {sg.get("id"): sg.get("name") for sg in source_sitegroups_preflight}
-
-    site_plan_ids = [sp.get("source_site_id") for sp in site_plans if sp.get("source_site_id")]
-    site_details_map: dict = {}
-    if site_plan_ids:
-        with ThreadPoolExecutor(max_workers=min(len(site_plan_ids), 10)) as _ex:
-            _fut_map = {
-                _ex.submit(get_site_details, session, sid, source_base_url): sid
-                for sid in site_plan_ids
-            }
-            for _future in as_completed(_fut_map):
-                site_details_map[_fut_map[_future]] = _future.result()
+    source_sg_id_to_name = build_sitegroup_id_to_name(source_sitegroups_preflight)
 
     per_site_sitegroups = []
     for site_plan in site_plans:
@@ -88,8 +84,7 @@ def build_preflight_report(session, source_org_id, source_site_id, template_name
             source_plan_site_id = site_plan.get("source_site_id")
             if not source_plan_site_id:
                 continue
-            source_site_details = site_details_map.get(source_plan_site_id) or \
-                get_site_details(session, source_plan_site_id, base_url=source_base_url)
+            source_site_details = site_details_map[source_plan_site_id]
             source_template_ids = derive_source_site_template_ids(
                 source_site_details,
                 site_id=source_plan_site_id,
@@ -100,9 +95,7 @@ def build_preflight_report(session, source_org_id, source_site_id, template_name
                 source_site_details,
                 source_id_to_name,
                 {},
-                site_id=source_plan_site_id,
-                wlan_site_map=wlan_site_map,
-                wlan_org_level_ids=wlan_org_level_ids,
+                source_ids=source_template_ids,
             )
             skip_reasons = compute_mode4_skip_reasons(
                 source_template_ids,
@@ -177,13 +170,15 @@ def preflight_summary(preflight_report, template_assignment_mode=""):
 
 def build_preflight_markdown(report: dict, template_assignment_mode: str = "") -> str:
     lines = []
-
-    def h1(t):  lines.extend([f"# {t}", ""])
-    def h2(t):  lines.extend([f"## {t}", ""])
-    def h3(t):  lines.extend([f"### {t}", ""])
-    def row(*cols): lines.append("| " + " | ".join(str(c) for c in cols) + " |")
-    def sep(*cols): lines.append("|" + "|".join(["---"] * len(cols)) + "|")
-    def blank():    lines.append("")
+    _append = lines.append
+    _extend = lines.extend
+
+    def h1(t):  _extend((f"# {t}", ""))
+    def h2(t):  _extend((f"## {t}", ""))
+    def h3(t):  _extend((f"### {t}", ""))
+    def row(*cols): _append("| " + " | ".join(map(str, cols)) + " |")
+    def sep(*cols): _append("|" + "|".join(["---"] * len(cols)) + "|")
+    def blank():    _append("")
 
     h1("Mist Org Clone — Preflight Report")
     lines.append(f"*Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*")
@@ -1,11 +1,38 @@
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
 DEFAULT_TIMEOUT = (5, 30)
+POST_WORKERS = 8
+PAGE_WORKERS = 8
+# clone_nac runs up to five POST fan-outs at once; size the pool so none wait on a connection.
+MAX_CONCURRENT_FAN_OUTS = 5
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def pool_size_for(workers):
+    return max(20, 2 * workers)
+
 
+DEFAULT_POOL_SIZE = pool_size_for(MAX_CONCURRENT_FAN_OUTS * POST_WORKERS)
 
-def build_session(extra_headers=None, pool_size=20):
+SITE_WORKERS = 10
+SITE_PREFETCH_WORKERS = 4
+MAP_IMAGE_WORKERS = 8
+# A site either pre-fetches its source data or runs its copy steps: the settings PUT, the
+# WLAN POSTs and the maps step, which fans out to its image uploads. In same-cloud runs one
+# session carries both the source reads and the destination writes of every site worker.
+SITE_PHASE_POOL_SIZE = max(
+    DEFAULT_POOL_SIZE,
+    pool_size_for(SITE_WORKERS * max(SITE_PREFETCH_WORKERS, 2 + MAP_IMAGE_WORKERS)),
+)
+
+
+def build_session(extra_headers=None, pool_size=DEFAULT_POOL_SIZE, base_url=None):
     session = requests.Session()
     retries = Retry(
         total=5,
@@ -17,19 +44,37 @@ def build_session(extra_headers=None, pool_size=20):
         max_retries=retries,
         pool_connections=pool_size,
         pool_maxsize=pool_size,
+        pool_block=True,
     )
     session.mount("https://", adapter)
     session.mount("http://", adapter)
+    session.headers.update({"Connection": "keep-alive"})
     if extra_headers:
         session.headers.update(extra_headers)
+    if base_url:
+        threading.Thread(target=_warm_up, args=(session, base_url), daemon=True).start()
     return session
 
 
-def api_request(session, method, url, payload=None, ok_status=(200,)):
+def _warm_up(session, base_url):
+    # Opens the first pooled connection (DNS, TCP, TLS) while the caller is still prompting.
+    try:
+        session.head(f"{base_url}/self", timeout=(5, 5))
+    except Exception:
+        pass
+
+
+def api_request(session, method, url, payload=None, ok_status=(200,), data=None):
+    headers = None
+    if payload is not None:
+        data = json.dumps(payload, separators=(",", ":"), allow_nan=False).encode()
+    if data is not None:
+        headers = _JSON_HEADERS
     response = session.request(
         method,
         url,
-        json=payload,
+        data=data,
+        headers=headers,
         timeout=DEFAULT_TIMEOUT
     )
     if response.status_code in ok_status:
@@ -37,18 +82,63 @@ def api_request(session, method, url, payload=None, ok_status=(200,)):
     raise Exception(f"{method} {url} failed: {response.text}")
 
 
-def _paginate(session, url):
-    results = []
+def api_get_json(session, url):
+    return json.loads(api_request(session, "GET", url).content)
+
+
+def _iter_pages(session, url):
     page = 1
     limit = 1000
     sep = "&" if "?" in url else "?"
     while True:
         paged = f"{url}{sep}page={page}&limit={limit}"
-        data = api_request(session, "GET", paged).json()
+        response = api_request(session, "GET", paged)
+        data = json.loads(response.content)
+        yield data
+        if not isinstance(data, list) or len(data) < limit:
+            return
+        total = response.headers.get("X-Page-Total")
+        if total and total.isdigit():
+            yield from _fetch_remaining_pages(session, f"{url}{sep}", page, limit, int(total))
+            return
+        page += 1
+
+
+def _fetch_remaining_pages(session, base, page, limit, total):
+    last_page = -(-total // limit)
+    if last_page <= page:
+        return
+
+    def _get_page(n):
+        return api_get_json(session, f"{base}page={n}&limit={limit}")
+
+    with ThreadPoolExecutor(max_workers=min(PAGE_WORKERS, last_page - page)) as ex:
+        futures = [ex.submit(_get_page, n) for n in range(page + 1, last_page + 1)]
+        for future in futures:
+            yield future.result()
+
+
+def _paginate(session, url):
+    results = []
+    for data in _iter_pages(session, url):
         if not isinstance(data, list):
             return data
         results.extend(data)
-        if len(data) < limit:
-            break
-        page += 1
     return results
+
+
+def _response_id(response):
+    return response.json().get("id")
+
+
+def _post_many(session, url, payloads, ok_status=(200, 201), parse=None):
+    def _post_one(payload):
+        try:
+            response = api_request(session, "POST", url, payload=payload, ok_status=ok_status)
+            return (parse(response) if parse else response), None
+        except Exception as exc:
+            return None, exc
+
+    with ThreadPoolExecutor(max_workers=POST_WORKERS) as ex:
+        futures = [ex.submit(_post_one, payload) for payload in payloads]
+    return [future.result() for future in futures]
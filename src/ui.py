@@ -8,12 +8,27 @@ no third-party dependencies required.
 Log capture
 -----------
 Call start_log() to begin recording every printed line in plain text.
-Call get_log_lines() to retrieve the captured lines as a list of strings.
+Call get_log_lines() to retrieve the captured lines as a list of strings,
+or iter_log_lines() to walk them without building a copy.
 Call stop_log() to end capture without clearing the buffer.
+Pass start_log() a path to stream the lines to that file instead; the file
+is flushed at every section header and closed by stop_log().
+
+Deferred output
+---------------
+Inside a `with deferred() as events:` block, status output from the
+current thread is recorded into `events` instead of printed. Pass the
+list to replay() later to print (and log) it, e.g. to keep the output of
+concurrent phases in a fixed order.
 """
 
+import functools
+import itertools
 import os
 import sys
+import threading
+from contextlib import contextmanager
+from typing import Optional
 
 # ──────────────────────────────────────────────────────────────────
 # ANSI support detection
@@ -38,43 +53,144 @@ _BLUE   = "\033[34m"
 _WHITE  = "\033[97m"
 
 
-def _c(code: str, text: str) -> str:
-    """Wrap text in an ANSI code (no-op when color is disabled)."""
-    if _USE_COLOR:
-        return f"{code}{text}{_RESET}"
+def _c_color(code: str, text: str) -> str:
+    """Wrap text in an ANSI code."""
+    return f"{code}{text}{_RESET}"
+
+
+def _c_plain(code: str, text: str) -> str:
+    """Return text unchanged (color is disabled)."""
     return text
 
 
+# Picked once: _USE_COLOR is fixed at import, so _c never branches per call.
+_c = _c_color if _USE_COLOR else _c_plain
+
+
 # ──────────────────────────────────────────────────────────────────
 # Log-capture buffer
 # ──────────────────────────────────────────────────────────────────
 
-_LOG_LINES: list[str] = []
-_LOG_ENABLED: bool = False
+# Captured lines are kept in fixed-size blocks so a long run never has to
+# grow (and copy) one huge list.
+_LOG_BLOCK_SIZE = 1024
+_LOG_BLOCKS: list[list[str]] = []
+_LOG_CURRENT: list[str] = []
+
+
+def _log_noop(md_line: str) -> None:
+    """Discard a line (capture is off)."""
+
+
+def _log_capture(md_line: str) -> None:
+    """Append a plain-text/markdown line to the current block."""
+    global _LOG_CURRENT
+    _LOG_CURRENT.append(md_line)
+    if len(_LOG_CURRENT) >= _LOG_BLOCK_SIZE:
+        _LOG_BLOCKS.append(_LOG_CURRENT)
+        _LOG_CURRENT = []
+
+
+# Rebound by start_log()/stop_log() rather than tested on every call. The
+# helpers look _log up at call time, so replayed deferred output honours
+# whichever is current.
+_log = _log_noop
+
 
+_LOG_FILE = None
 
-def start_log() -> None:
-    """Enable log capture and clear any previously captured lines."""
-    global _LOG_ENABLED, _LOG_LINES
-    _LOG_ENABLED = True
-    _LOG_LINES = []
+
+def start_log(path: Optional[str] = None, header: str = "") -> None:
+    """Enable log capture and clear any previously captured lines.
+
+    With a path, lines are streamed to that file (after `header`) as they
+    are logged instead of being kept in memory.
+    """
+    global _log, _LOG_BLOCKS, _LOG_CURRENT, _LOG_FILE
+    stop_log()
+    _LOG_BLOCKS = []
+    _LOG_CURRENT = []
+    if path:
+        _LOG_FILE = open(path, "w", encoding="utf-8", buffering=1 << 16)
+        _LOG_FILE.write(header)
+        write = _LOG_FILE.write
+
+        def _log_stream(md_line: str) -> None:
+            write(md_line + "\n")
+
+        _log = _log_stream
+    else:
+        _log = _log_capture
 
 
 def stop_log() -> None:
-    """Disable log capture (buffer is preserved)."""
-    global _LOG_ENABLED
-    _LOG_ENABLED = False
+    """Disable log capture (buffer is preserved, a streamed file is closed)."""
+    global _log, _LOG_FILE
+    _log = _log_noop
+    if _LOG_FILE is not None:
+        _LOG_FILE.close()
+        _LOG_FILE = None
+
+
+def flush_log() -> None:
+    """Write a streamed log's buffered lines through to disk."""
+    if _LOG_FILE is not None:
+        _LOG_FILE.flush()
+
+
+def log_path() -> Optional[str]:
+    """Return the file being streamed to, or None when buffering in memory."""
+    return _LOG_FILE.name if _LOG_FILE is not None else None
+
+
+def iter_log_lines():
+    """Iterate over all captured log lines without copying them."""
+    return itertools.chain.from_iterable((*_LOG_BLOCKS, _LOG_CURRENT))
 
 
 def get_log_lines() -> list[str]:
     """Return a copy of all captured log lines."""
-    return list(_LOG_LINES)
+    return list(iter_log_lines())
 
 
-def _log(md_line: str) -> None:
-    """Append a plain-text/markdown line to the buffer when capture is active."""
-    if _LOG_ENABLED:
-        _LOG_LINES.append(md_line)
+# ──────────────────────────────────────────────────────────────────
+# Deferred output
+# ──────────────────────────────────────────────────────────────────
+
+_DEFERRED = threading.local()
+
+
+@contextmanager
+def deferred():
+    """Record this thread's status output instead of printing it."""
+    previous = getattr(_DEFERRED, "events", None)
+    events = []
+    _DEFERRED.events = events
+    try:
+        yield events
+    finally:
+        _DEFERRED.events = previous
+
+
+def replay(events: list) -> None:
+    """Print (and log) output recorded by deferred(), in order."""
+    current = getattr(_DEFERRED, "events", None)
+    if current is not None:
+        current.extend(events)
+        return
+    for fn, args, kwargs in events:
+        fn(*args, **kwargs)
+
+
+def _deferrable(fn):
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        events = getattr(_DEFERRED, "events", None)
+        if events is not None:
+            events.append((fn, args, kwargs))
+            return
+        fn(*args, **kwargs)
+    return wrapper
 
 
 # ──────────────────────────────────────────────────────────────────
@@ -84,24 +200,52 @@ def _log(md_line: str) -> None:
 WIDTH = 70
 
 
-def _rule(char: str = "─") -> str:
-    return char * WIDTH
+_RULE_DASH = "─" * WIDTH
+_RULE_DOT  = "·" * WIDTH
+_RULE_DBL  = "═" * WIDTH
+
+
+# ──────────────────────────────────────────────────────────────────
+# Precomputed prefixes
+# ──────────────────────────────────────────────────────────────────
+
+# Colour never changes after import, so the fixed parts of every status
+# line are built once here instead of on each call.
+_MSG_CLOSE       = _RESET if _USE_COLOR else ""
+_MSG_END         = _MSG_CLOSE + "\n"
+_PREFIX_OK       = _c(_GREEN + _BOLD, "  ✓ ")
+_PREFIX_WARN     = _c(_YELLOW + _BOLD, "  ! ") + (_YELLOW if _USE_COLOR else "")
+_PREFIX_ERROR    = _c(_RED + _BOLD, "  ✗ ") + (_RED if _USE_COLOR else "")
+_PREFIX_PROGRESS = _c(_DIM, "  ⋯ ") + (_DIM if _USE_COLOR else "")
+_PREFIX_BULLET   = "  " + _c(_BOLD, "•") + " "
+_NUM_OPEN        = "  " + (_CYAN + _BOLD if _USE_COLOR else "")
+_NUM_CLOSE       = _MSG_CLOSE + ".  "
+_ASK_LEADER      = _c(_CYAN, "\n  ? ")
+_ASK_ARROW       = "\n    → "
+_HINT_YES        = _c(_DIM, " (Y/n)")
+_HINT_NO         = _c(_DIM, " (y/N)")
+_YN_RETRY        = _c(_YELLOW, "    Please enter y or n.")
+_BANNER_RULE     = _c(_CYAN + _BOLD, _RULE_DBL)
+_SECTION_RULE    = _c(_BOLD, _RULE_DASH)
+_DIVIDER_RULE    = _c(_DIM, _RULE_DOT)
+_MENU_RULE       = _c(_DIM, "  " + "─" * (WIDTH - 4))
 
 
 # ──────────────────────────────────────────────────────────────────
 # Structural elements
 # ──────────────────────────────────────────────────────────────────
 
+@_deferrable
 def banner(title: str, subtitle: str = "") -> None:
     """Print a prominent top-of-run banner."""
     print()
-    print(_c(_CYAN + _BOLD, "═" * WIDTH))
+    print(_BANNER_RULE)
     pad = max((WIDTH - len(title)) // 2, 0)
     print(_c(_CYAN + _BOLD, " " * pad + title))
     if subtitle:
         sub_pad = max((WIDTH - len(subtitle)) // 2, 0)
         print(_c(_DIM, " " * sub_pad + subtitle))
-    print(_c(_CYAN + _BOLD, "═" * WIDTH))
+    print(_BANNER_RULE)
     print()
     _log(f"# {title}")
     if subtitle:
@@ -109,19 +253,24 @@ def banner(title: str, subtitle: str = "") -> None:
     _log("")
 
 
+@_deferrable
 def section(title: str) -> None:
     """Print a section / phase header with surrounding rules."""
     print()
-    print(_c(_BOLD, _rule()))
+    print(_SECTION_RULE)
     print(_c(_BOLD, f"  {title}"))
-    print(_c(_BOLD, _rule()))
+    print(_SECTION_RULE)
     _log(f"\n## {title}")
     _log("---")
+    # Flushes what has been logged so far. Deferred output (e.g. a site cloned in parallel)
+    # is only logged, and so only flushed, when it is replayed.
+    flush_log()
 
 
+@_deferrable
 def divider() -> None:
     """Print a lightweight separator line."""
-    print(_c(_DIM, _rule("·")))
+    print(_DIVIDER_RULE)
     _log("---")
 
 
@@ -129,43 +278,61 @@ def divider() -> None:
 # Status / log lines
 # ──────────────────────────────────────────────────────────────────
 
+# These write to sys.stdout directly rather than via print(). stdout is
+# looked up on each call so redirect_stdout() still applies.
+
+@_deferrable
 def ok(msg: str) -> None:
     """Success confirmation."""
-    print(_c(_GREEN + _BOLD, "  ✓ ") + msg)
+    sys.stdout.write(_PREFIX_OK + msg + "\n")
     _log(f"✓ {msg}")
 
 
+@_deferrable
 def warn(msg: str) -> None:
     """Non-fatal warning."""
-    print(_c(_YELLOW + _BOLD, "  ! ") + _c(_YELLOW, msg))
+    sys.stdout.write(_PREFIX_WARN + msg + _MSG_END)
     _log(f"⚠️  {msg}")
 
 
+@_deferrable
 def error(msg: str) -> None:
     """Fatal error message."""
-    print(_c(_RED + _BOLD, "  ✗ ") + _c(_RED, msg))
+    sys.stdout.write(_PREFIX_ERROR + msg + _MSG_END)
     _log(f"✗ {msg}")
 
 
+@_deferrable
 def info(msg: str) -> None:
     """Neutral informational line."""
-    print("    " + msg)
+    sys.stdout.write("    " + msg + "\n")
     _log(f"    {msg}")
 
 
+@_deferrable
+def info_lines(lines: list[str]) -> None:
+    """Several informational lines, written to the terminal in one call."""
+    block = [f"    {line}" for line in lines]
+    sys.stdout.write("\n".join(block) + "\n")
+    for line in block:
+        _log(line)
+
+
+@_deferrable
 def progress(msg: str) -> None:
     """In-progress action indicator."""
-    print(_c(_DIM, "  ⋯ ") + _c(_DIM, msg))
+    sys.stdout.write(_PREFIX_PROGRESS + msg + _MSG_END)
     _log(f"⋯ {msg}")
 
 
+@_deferrable
 def bullet(label: str, value: str = "") -> None:
     """Print a labelled bullet point."""
     if value:
-        print(f"  {_c(_BOLD, '•')} {_c(_BOLD, label)}: {value}")
+        sys.stdout.write(_PREFIX_BULLET + _c(_BOLD, label) + ": " + value + "\n")
         _log(f"- **{label}**: {value}")
     else:
-        print(f"  {_c(_BOLD, '•')} {label}")
+        sys.stdout.write(_PREFIX_BULLET + label + "\n")
         _log(f"- {label}")
 
 
@@ -181,7 +348,7 @@ def menu(title: str, options: list[tuple]) -> None:
     """
     print()
     print(_c(_BOLD, f"  {title}"))
-    print(_c(_DIM, "  " + "─" * (WIDTH - 4)))
+    print(_MENU_RULE)
     for key, label in options:
         print(f"    {_c(_CYAN + _BOLD, str(key))}.  {label}")
     print()
@@ -192,23 +359,38 @@ def numbered_list(items: list, name_key: str = "name", id_key: str = "id") -> No
     Print a numbered list of dicts or plain strings.
 
     For dicts the name_key field is used as the label, id_key as a dim suffix.
+    The first item decides which; lists are not expected to mix the two.
     """
+    if not items:
+        return
+    if isinstance(items[0], dict):
+        lines = _numbered_dict_lines(items, name_key, id_key)
+    else:
+        lines = [f"{_NUM_OPEN}{idx}{_NUM_CLOSE}{item}" for idx, item in enumerate(items, start=1)]
+    print("\n".join(lines))
+
+
+def _numbered_dict_lines(items: list, name_key: str, id_key: str) -> list[str]:
+    lines = []
     for idx, item in enumerate(items, start=1):
-        if isinstance(item, dict):
-            name    = item.get(name_key, "<unnamed>")
-            item_id = item.get(id_key)
-            suffix  = f"  {_c(_DIM, f'({item_id})')}" if item_id else ""
-            print(f"  {_c(_CYAN + _BOLD, str(idx))}.  {name}{suffix}")
-        else:
-            print(f"  {_c(_CYAN + _BOLD, str(idx))}.  {item}")
+        name    = item.get(name_key, "<unnamed>")
+        item_id = item.get(id_key)
+        suffix  = f"  {_c(_DIM, f'({item_id})')}" if item_id else ""
+        lines.append(f"{_NUM_OPEN}{idx}{_NUM_CLOSE}{name}{suffix}")
+    return lines
 
 
 def summarize_list(items: list, label: str, name_key: str = "name", max_items: int = 5) -> None:
     """Print a compact bullet summary of a list (used in preflight)."""
-    names  = [item.get(name_key, "<unnamed>") if isinstance(item, dict) else str(item) for item in items]
-    sample = ", ".join(names[:max_items])
-    suffix = f" … (+{len(names) - max_items} more)" if len(names) > max_items else ""
-    bullet(label, f"{len(names)}  {sample + suffix}")
+    count  = len(items)
+    shown  = list(itertools.islice(items, max_items))
+    if shown and isinstance(shown[0], dict):
+        names = [item.get(name_key, "<unnamed>") for item in shown]
+    else:
+        names = list(map(str, shown))
+    sample = ", ".join(names)
+    suffix = f" … (+{count - max_items} more)" if count > max_items else ""
+    bullet(label, f"{count}  {sample + suffix}")
 
 
 # ──────────────────────────────────────────────────────────────────
@@ -222,10 +404,10 @@ def ask(label: str, default=None, allow_empty: bool = False) -> str:
     Shows a cyan '?' leader, the label, and a dim default hint.
     Returns the entered string (or default when the user presses Enter).
     """
-    prompt = _c(_CYAN, "\n  ? ") + _c(_BOLD, label)
+    prompt = _ASK_LEADER + _c(_BOLD, label)
     if default is not None:
         prompt += _c(_DIM, f"  [{default}]")
-    prompt += "\n    → "
+    prompt += _ASK_ARROW
     while True:
         value = input(prompt).strip()
         if not value and default is not None:
@@ -244,8 +426,8 @@ def ask_yn(label: str, default: bool = True) -> bool:
     Shows a cyan '?' leader and dim (Y/n) or (y/N) hint.
     Returns True/False.
     """
-    hint   = _c(_DIM, " (Y/n)" if default else " (y/N)")
-    prompt = _c(_CYAN, "\n  ? ") + _c(_BOLD, label) + hint + "\n    → "
+    hint   = _HINT_YES if default else _HINT_NO
+    prompt = _ASK_LEADER + _c(_BOLD, label) + hint + _ASK_ARROW
     while True:
         response = input(prompt).strip().lower()
         if not response:
@@ -257,10 +439,10 @@ def ask_yn(label: str, default: bool = True) -> bool:
         if response in {"n", "no"}:
             _log(f"> **{label}**: No")
             return False
-        print(_c(_YELLOW, "    Please enter y or n."))
+        print(_YN_RETRY)
 
 
 # Internal helper so warn() can be called without a side-effect print
 # when constructing strings.
 def warn_str(msg: str) -> str:
-    return _c(_YELLOW + _BOLD, "  ! ") + _c(_YELLOW, msg)
+    return _PREFIX_WARN + msg + _MSG_CLOSE
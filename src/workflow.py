@@ -1,29 +1,45 @@
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
 
 import ui
 from config import RunConfig, validate_config_vars, load_dest_config
-from session import build_session, api_request
+from session import build_session, api_request, SITE_WORKERS, SITE_PHASE_POOL_SIZE
 from prompts import prompt_input, prompt_yes_no
 from mist.orgs import clone_organization, invite_super_users, fetch_alarm_templates, clone_alarm_templates
 from mist.sites import (create_site, copy_site_settings, clone_site_wlans,
-                        clone_site_maps, get_site_details, _prefetch_source_site_data)
+                        clone_site_maps, get_source_site_details, _prefetch_source_site_data)
 from mist.templates import (
     build_template_maps, build_wlan_scope_info, build_new_template_id_map,
     normalize_template_ids, derive_source_site_template_ids,
     resolve_template_ids_from_source, compute_mode4_skip_reasons,
     format_template_skip_warnings, format_assigned_template_names,
     assign_templates, finalize_wlan_assignments, prompt_template_choices_for_org,
+    resolve_template_choices,
 )
-from mist.sitegroups import fetch_sitegroups, build_sitegroup_name_to_id, clone_sitegroup_membership
+from mist.sitegroups import (fetch_sitegroups, build_sitegroup_name_to_id, build_sitegroup_id_to_name,
+                             resolve_sitegroup_ids)
 from mist.nac import clone_nac
 from mist.cross_cloud import cross_cloud_bootstrap_org, remap_gateway_template_service_policies
+from preflight import build_preflight_report, preflight_summary, build_preflight_markdown
 
 
 def run_clone_flow(source_session, dest_session, source_base_url, dest_base_url,
                    template_name_map, cfg: RunConfig, cross_cloud=False):
+    """
+    Clone the source org, its NAC config and the planned sites.
+
+    Both sessions are expected to come from build_session(), whose pooled,
+    retrying HTTPAdapter is shared by the concurrent clone phases.
+    """
     ui.section("Step 4 — Cloning Organization")
 
+    source_alarm_templates = fetch_alarm_templates(
+        source_session, cfg.source_organization_id, base_url=source_base_url
+    )
+
     if cross_cloud:
         ui.progress("Bootstrapping organization on destination cloud …")
         new_org_id = cross_cloud_bootstrap_org(
@@ -31,6 +47,7 @@ def run_clone_flow(source_session, dest_session, source_base_url, dest_base_url,
             cfg.source_organization_id,
             cfg.new_organization_name,
             source_base_url, dest_base_url,
+            _cached_alarm_templates=source_alarm_templates,
         )
         ui.ok(f"Organization bootstrapped on destination  →  ID: {new_org_id}")
     else:
@@ -52,264 +69,189 @@ def run_clone_flow(source_session, dest_session, source_base_url, dest_base_url,
             source_session, dest_session,
             cfg.source_organization_id, new_org_id,
             source_base_url=source_base_url, dest_base_url=dest_base_url,
+            _cached_alarm_templates=source_alarm_templates,
         )
 
-    ui.section("Access Assurance (NAC)")
-    if ui.ask_yn("Clone Access Assurance (NAC) configuration?", default=True):
-        clone_nac(
-            source_session, dest_session,
-            cfg.source_organization_id, new_org_id,
-            source_base_url=source_base_url, dest_base_url=dest_base_url,
-        )
-    else:
-        ui.info("NAC cloning skipped.")
-
-    source_maps, new_maps, new_templates = build_template_maps(
-        source_session,
-        cfg.source_organization_id,
-        new_org_id,
-        source_base_url=source_base_url,
-        dest_base_url=dest_base_url,
-        dest_session=dest_session,
-    )
-    new_id_name_map = build_new_template_id_map(new_templates)
-
-    source_alarm_templates = fetch_alarm_templates(
-        source_session, cfg.source_organization_id, base_url=source_base_url
-    )
-    new_alarm_templates = fetch_alarm_templates(dest_session, new_org_id, base_url=dest_base_url)
-    source_alarm_id_to_name = {t.get("id"): t.get("name") for t in source_alarm_templates if t.get("id")}
-    new_alarm_name_to_id = {t.get("name"): t.get("id") for t in new_alarm_templates if t.get("name")}
-
-    _, new_org_wlan_org_ids = build_wlan_scope_info(dest_session, new_org_id, base_url=dest_base_url)
-
-    source_sitegroups = fetch_sitegroups(
-        source_session, cfg.source_organization_id, base_url=source_base_url
-    )
-    new_sitegroups = fetch_sitegroups(dest_session, new_org_id, base_url=dest_base_url)
-    new_sitegroup_name_to_id = build_sitegroup_name_to_id(new_sitegroups)
-    if source_sitegroups:
-        ui.info(f"Site groups: {len(source_sitegroups)} in source, {len(new_sitegroups)} in new org.")
-
-    assignment_mode = cfg.template_assignment_mode
-    global_template_ids = {}
-    per_site_apply_all = False
-    per_site_template_ids = {}
-    wlan_site_map = {}
-    wlan_org_level_ids: set = set()
-    site_level_wlan_map: dict = {}
-    org_level_wlan_ids_new: set = set()
-
-    if assignment_mode == "4":
-        wlan_site_map, wlan_org_level_ids = build_wlan_scope_info(
-            source_session, cfg.source_organization_id, base_url=source_base_url
-        )
-
-    if assignment_mode in {"2", "3"}:
-        ui.section("Template Selection (applies to all sites)")
-        name_choices = prompt_template_choices_for_org(new_templates)
-        for key, name in name_choices.items():
-            new_id = new_maps.get(key, {}).get(name)
-            if not new_id:
-                continue
-            if key == "wlan" and new_id in new_org_wlan_org_ids:
-                global_template_ids["wlan_org"] = new_id
-            else:
-                global_template_ids[key] = new_id
-    elif assignment_mode == "1":
-        per_site_apply_all = prompt_yes_no(
-            "Use the same template selection for all sites?",
-            default=False
-        )
-        if per_site_apply_all:
-            ui.section("Template Selection (applies to all sites)")
-            name_choices = prompt_template_choices_for_org(new_templates)
-            for key, name in name_choices.items():
-                new_id = new_maps.get(key, {}).get(name)
-                if not new_id:
-                    continue
-                if key == "wlan" and new_id in new_org_wlan_org_ids:
-                    per_site_template_ids["wlan_org"] = new_id
-                else:
-                    per_site_template_ids[key] = new_id
-
-    site_plans = cfg.site_plans
-
-    pre_fetched: dict = {}
-    if site_plans:
-        ui.progress(f"Pre-fetching source data for {len(site_plans)} site(s) …")
-        with ThreadPoolExecutor(max_workers=min(len(site_plans), 10)) as pool:
-            futs = {
-                pool.submit(
-                    _prefetch_source_site_data,
-                    source_session,
-                    sp["source_site_id"],
-                    source_base_url,
-                ): sp["source_site_id"]
-                for sp in site_plans
-            }
-            for fut in as_completed(futs):
-                sid = futs[fut]
-                try:
-                    pre_fetched[sid] = fut.result()
-                except Exception as exc:
-                    pre_fetched[sid] = {}
-                    ui.warn(f"Pre-fetch failed for source site {sid}: {exc}")
-        ui.ok(f"Source site data pre-fetched for {len(pre_fetched)} site(s).")
-
-    for site_plan in site_plans:
-        cached = pre_fetched.get(site_plan["source_site_id"], {})
-        skip_reasons = {}
-        ui.section(f"Site  →  {site_plan['new_site_name']}")
-        ui.progress(f"Creating site '{site_plan['new_site_name']}' …")
-        source_details = cached.get("details") or {}
-        source_timezone = site_plan.get("timezone") or source_details.get("timezone")
-        new_site_id = create_site(
-            dest_session,
+    # This pool runs the setup fetches and then the site clones (SITE_WORKERS at a time).
+    # Each site task opens nested pools of its own: the source pre-fetch
+    # (SITE_PREFETCH_WORKERS), the copy steps (one per _SITE_COPY_STEPS entry) and, inside
+    # the maps step, the image uploads (MAP_IMAGE_WORKERS). They are not submitted here
+    # because a site task waiting on work queued behind other site tasks could deadlock.
+    pool = ThreadPoolExecutor(max_workers=SITE_WORKERS)
+    try:
+        # None of the per-site metadata depends on what NAC creates, so fetch it while the
+        # NAC prompt and clone run.
+        template_maps_future = pool.submit(
+            build_template_maps,
+            source_session,
+            cfg.source_organization_id,
             new_org_id,
-            site_plan["new_site_name"],
-            site_plan["new_site_address"],
-            site_plan["country_code"],
-            base_url=dest_base_url,
-            timezone=source_timezone,
-        )
-        ui.ok(f"Site created  →  ID: {new_site_id}")
-
-        ui.progress("Copying site settings …")
-        copy_site_settings(
-            source_session, site_plan["source_site_id"], new_site_id,
-            source_base_url=source_base_url, dest_base_url=dest_base_url,
+            source_base_url=source_base_url,
+            dest_base_url=dest_base_url,
             dest_session=dest_session,
-            _cached_settings=cached.get("settings"),
         )
-        ui.ok("Site settings copied.")
-
-        ui.progress("Copying site-specific WLANs …")
-        wlan_count = clone_site_wlans(
-            source_session, dest_session,
-            site_plan["source_site_id"], new_site_id,
-            source_base_url=source_base_url, dest_base_url=dest_base_url,
-            _cached_wlans=cached.get("wlans"),
-        )
-        if wlan_count:
-            ui.ok(f"Site-specific WLANs copied: {wlan_count}")
-        else:
-            ui.info("No site-specific WLANs found.")
-
-        ui.progress("Copying site floor plan maps …")
-        maps_count = clone_site_maps(
-            source_session, dest_session,
-            site_plan["source_site_id"], new_site_id,
-            source_base_url=source_base_url, dest_base_url=dest_base_url,
-            _cached_maps=cached.get("maps"),
+        new_alarm_templates_future = pool.submit(
+            fetch_alarm_templates, dest_session, new_org_id, base_url=dest_base_url
         )
-        if maps_count:
-            ui.ok(f"Site maps copied: {maps_count}")
-        else:
-            ui.info("No site maps found.")
-
-        source_site_details_for_sg = (
-            cached.get("details")
-            or get_site_details(source_session, site_plan["source_site_id"], base_url=source_base_url)
+        source_sitegroups_future = pool.submit(
+            fetch_sitegroups, source_session, cfg.source_organization_id, base_url=source_base_url
         )
-        unmatched_sitegroups = clone_sitegroup_membership(
-            dest_session,
-            source_site_details_for_sg,
-            source_sitegroups,
-            new_sitegroup_name_to_id,
-            new_org_id,
-            new_site_id,
-            base_url=dest_base_url,
+        new_sitegroups_future = pool.submit(
+            fetch_sitegroups, dest_session, new_org_id, base_url=dest_base_url
         )
-        matched_sg_count = len((source_site_details_for_sg.get("sitegroup_ids") or [])) - len(unmatched_sitegroups)
-        if matched_sg_count > 0:
-            ui.ok(f"Site group membership applied: {matched_sg_count} group(s).")
-        if unmatched_sitegroups:
-            ui.warn(f"Unmatched site groups for '{site_plan['new_site_name']}': {', '.join(str(x) for x in unmatched_sitegroups)}")
-
-        source_alarm_id = source_site_details_for_sg.get("alarmtemplate_id")
-        if source_alarm_id:
-            alarm_name = source_alarm_id_to_name.get(source_alarm_id)
-            new_alarm_id = new_alarm_name_to_id.get(alarm_name) if alarm_name else None
-            if new_alarm_id:
-                alarm_url = f'{dest_base_url}/sites/{new_site_id}'
-                api_request(dest_session, "PUT", alarm_url, payload={"alarmtemplate_id": new_alarm_id})
-                ui.ok(f"Alarm template '{alarm_name}' assigned.")
-            else:
-                ui.warn(f"Alarm template ID '{source_alarm_id}' could not be remapped — no matching name found in new org.")
 
-        if assignment_mode == "4":
-            source_site_details = source_site_details_for_sg
-            source_template_ids = derive_source_site_template_ids(
-                source_site_details,
-                site_id=site_plan["source_site_id"],
-                wlan_site_map=wlan_site_map,
-                wlan_org_level_ids=wlan_org_level_ids,
+        ui.section("Access Assurance (NAC)")
+        if ui.ask_yn("Clone Access Assurance (NAC) configuration?", default=True):
+            clone_nac(
+                source_session, dest_session,
+                cfg.source_organization_id, new_org_id,
+                source_base_url=source_base_url, dest_base_url=dest_base_url,
             )
-            resolved_template_ids = resolve_template_ids_from_source(
-                source_site_details,
-                source_maps,
-                new_maps,
-                site_id=site_plan["source_site_id"],
-                wlan_site_map=wlan_site_map,
-                wlan_org_level_ids=wlan_org_level_ids,
+        else:
+            ui.info("NAC cloning skipped.")
+
+        source_maps, new_maps, new_templates = template_maps_future.result()
+        new_id_name_map = build_new_template_id_map(new_templates)
+
+        new_alarm_templates = new_alarm_templates_future.result()
+        new_alarm_name_to_id = {}
+        for t in new_alarm_templates:
+            name = t.get("name")
+            if name:
+                new_alarm_name_to_id[name] = t.get("id")
+        source_alarm_id_to_name = {}
+        source_alarm_to_new_id = {}
+        for t in source_alarm_templates:
+            sid = t.get("id")
+            if sid:
+                name = t.get("name")
+                source_alarm_id_to_name[sid] = name
+                source_alarm_to_new_id[sid] = new_alarm_name_to_id.get(name)
+
+        _, new_org_wlan_org_ids = build_wlan_scope_info(dest_session, new_org_id, base_url=dest_base_url)
+
+        source_sitegroups = source_sitegroups_future.result()
+        new_sitegroups = new_sitegroups_future.result()
+        new_sitegroup_name_to_id = build_sitegroup_name_to_id(new_sitegroups)
+        source_sitegroup_id_to_name = build_sitegroup_id_to_name(source_sitegroups)
+        if source_sitegroups:
+            ui.info(f"Site groups: {len(source_sitegroups)} in source, {len(new_sitegroups)} in new org.")
+
+        site_plans = cfg.site_plans
+        assignment_mode = cfg.template_assignment_mode
+        global_template_ids = {}
+        per_site_template_ids = [None] * len(site_plans)
+        wlan_site_map = {}
+        wlan_org_level_ids: frozenset = frozenset()
+        site_level_wlan_map: dict = {}
+        org_level_wlan_ids_new: set = set()
+
+        if assignment_mode == "4":
+            wlan_site_map, wlan_org_level_ids = build_wlan_scope_info(
+                source_session, cfg.source_organization_id, base_url=source_base_url
             )
-            template_ids = resolved_template_ids
-            skip_reasons = compute_mode4_skip_reasons(
-                source_template_ids,
-                resolved_template_ids,
-                source_maps
+
+        if assignment_mode in {"2", "3"}:
+            ui.section("Template Selection (applies to all sites)")
+            global_template_ids = resolve_template_choices(
+                prompt_template_choices_for_org(new_templates), new_maps, new_org_wlan_org_ids
             )
         elif assignment_mode == "1":
+            per_site_apply_all = prompt_yes_no(
+                "Use the same template selection for all sites?",
+                default=False
+            )
             if per_site_apply_all:
-                template_ids = per_site_template_ids
+                ui.section("Template Selection (applies to all sites)")
+                shared_template_ids = resolve_template_choices(
+                    prompt_template_choices_for_org(new_templates), new_maps, new_org_wlan_org_ids
+                )
+                per_site_template_ids = [shared_template_ids] * len(site_plans)
             else:
-                ui.section(f"Template Selection — {site_plan['new_site_name']}")
-                choices = prompt_template_choices_for_org(new_templates)
-                template_ids = {}
-                for key, name in choices.items():
-                    new_id = new_maps.get(key, {}).get(name)
-                    if not new_id:
-                        continue
-                    if key == "wlan" and new_id in new_org_wlan_org_ids:
-                        template_ids["wlan_org"] = new_id
-                    else:
-                        template_ids[key] = new_id
-        else:
-            template_ids = global_template_ids
-
-        template_ids = normalize_template_ids(template_ids)
-
-        site_wlan = template_ids.pop("wlan_template_id", None)
-        org_wlan  = template_ids.pop("wlan_org_template_id", None)
-
-        if site_wlan:
-            for tid in (site_wlan if isinstance(site_wlan, list) else [site_wlan]):
-                site_level_wlan_map.setdefault(tid, []).append(new_site_id)
-
-        if org_wlan:
-            for tid in (org_wlan if isinstance(org_wlan, list) else [org_wlan]):
-                org_level_wlan_ids_new.add(tid)
+                # Ask for every site's templates up front so the sites themselves can be cloned concurrently.
+                per_site_template_ids = []
+                for site_plan in site_plans:
+                    ui.section(f"Template Selection — {site_plan['new_site_name']}")
+                    per_site_template_ids.append(resolve_template_choices(
+                        prompt_template_choices_for_org(new_templates), new_maps, new_org_wlan_org_ids
+                    ))
+
+        ctx = _SiteCloneContext(
+            source_session=source_session,
+            dest_session=dest_session,
+            source_base_url=source_base_url,
+            dest_base_url=dest_base_url,
+            new_org_id=new_org_id,
+            assignment_mode=assignment_mode,
+            global_template_ids=global_template_ids,
+            source_maps=source_maps,
+            new_maps=new_maps,
+            new_id_name_map=new_id_name_map,
+            wlan_site_map=wlan_site_map,
+            wlan_org_level_ids=wlan_org_level_ids,
+            source_sitegroup_id_to_name=source_sitegroup_id_to_name,
+            new_sitegroup_name_to_id=new_sitegroup_name_to_id,
+            source_alarm_id_to_name=source_alarm_id_to_name,
+            source_alarm_to_new_id=source_alarm_to_new_id,
+        )
 
-        if not any(template_ids.values()):
-            ui.info("No non-WLAN templates selected for assignment.")
-        else:
-            ui.progress("Assigning non-WLAN templates …")
-            assign_templates(dest_session, new_org_id, new_site_id, template_ids,
-                             base_url=dest_base_url)
-
-        display_ids = dict(template_ids)
-        if site_wlan:
-            display_ids["wlan_template_id"] = site_wlan
-        if org_wlan:
-            display_ids["wlan_org_template_id"] = org_wlan
-        if display_ids:
-            assigned_names = format_assigned_template_names(display_ids, new_id_name_map)
-            ui.info(f"Deferred WLAN + non-WLAN plan: {assigned_names}")
-
-        if skip_reasons:
-            warning_summary = format_template_skip_warnings(skip_reasons)
-            ui.warn(f"Template assignment warnings: {warning_summary}")
+        def _merge_site_result(new_site_id, site_wlan, org_wlan):
+            if site_wlan:
+                for tid in (site_wlan if isinstance(site_wlan, list) else [site_wlan]):
+                    site_level_wlan_map.setdefault(tid, []).append(new_site_id)
+
+            if org_wlan:
+                for tid in (org_wlan if isinstance(org_wlan, list) else [org_wlan]):
+                    org_level_wlan_ids_new.add(tid)
+
+        # After the first failure no further sites are started; sites already running still
+        # finish, and their output is replayed so every created site shows up in the log.
+        site_failed = threading.Event()
+
+        def _clone_site_unless_failed(site_plan, site_template_ids):
+            if site_failed.is_set():
+                return None
+            try:
+                return _clone_site(ctx, site_plan, site_template_ids)
+            except Exception:
+                site_failed.set()
+                raise
+
+        site_futures = [
+            pool.submit(_deferred_call, _clone_site_unless_failed, sp, template_ids)
+            for sp, template_ids in zip(site_plans, per_site_template_ids)
+        ]
+        first_exc = None
+        not_started = 0
+        templates_assigned = 0
+        sites_with_templates = 0
+        for fut in site_futures:
+            if fut.cancelled():
+                not_started += 1
+                continue
+            events, result, exc = fut.result()
+            ui.replay(events)
+            if exc:
+                if first_exc is None:
+                    first_exc = exc
+                    pool.shutdown(wait=False, cancel_futures=True)
+            elif result is None:
+                not_started += 1
+            else:
+                new_site_id, site_wlan, org_wlan, assigned_count = result
+                _merge_site_result(new_site_id, site_wlan, org_wlan)
+                if assigned_count:
+                    templates_assigned += assigned_count
+                    sites_with_templates += 1
+        if templates_assigned:
+            ui.ok(f"Non-WLAN templates assigned: {templates_assigned} across {sites_with_templates} site(s).")
+        if first_exc is not None:
+            if not_started:
+                ui.warn(f"{not_started} site(s) not cloned because an earlier site failed.")
+            raise first_exc
+    finally:
+        # Also reached when NAC, a prompt or a setup fetch raises; queued work is dropped.
+        pool.shutdown(cancel_futures=True)
 
     finalize_wlan_assignments(
         dest_session,
@@ -329,8 +271,205 @@ def run_clone_flow(source_session, dest_session, source_base_url, dest_base_url,
         ui.info("No super users invited — none selected for this run.")
 
 
+@dataclass
+class _SiteCloneContext:
+    """Per-run state every site clone reads; built once the setup fetches are in."""
+    source_session: object
+    dest_session: object
+    source_base_url: str
+    dest_base_url: str
+    new_org_id: str
+    assignment_mode: str
+    global_template_ids: dict
+    source_maps: dict
+    new_maps: dict
+    new_id_name_map: dict
+    wlan_site_map: dict
+    wlan_org_level_ids: frozenset
+    source_sitegroup_id_to_name: dict
+    new_sitegroup_name_to_id: dict
+    source_alarm_id_to_name: dict
+    source_alarm_to_new_id: dict
+
+
+def _clone_site(ctx, site_plan, site_template_ids):
+    ui.section(f"Site  →  {site_plan['new_site_name']}")
+    # Each site fetches its own source data, so the first destination writes start after
+    # one site's fetch and at most SITE_WORKERS bundles are held at once.
+    try:
+        cached = _prefetch_source_site_data(ctx.source_session, site_plan["source_site_id"], ctx.source_base_url)
+    except Exception as exc:
+        cached = {}
+        ui.warn(f"Pre-fetch failed for source site {site_plan['source_site_id']}: {exc}")
+    skip_reasons = {}
+    ui.progress(f"Creating site '{site_plan['new_site_name']}' …")
+    source_details = cached.get("details") or {}
+    source_timezone = site_plan.get("timezone") or source_details.get("timezone")
+    new_site_id = create_site(
+        ctx.dest_session,
+        ctx.new_org_id,
+        site_plan["new_site_name"],
+        site_plan["new_site_address"],
+        site_plan["country_code"],
+        base_url=ctx.dest_base_url,
+        timezone=source_timezone,
+    )
+    ui.ok(f"Site created  →  ID: {new_site_id}")
+
+    step_args = (ctx.source_session, ctx.dest_session, site_plan["source_site_id"], new_site_id,
+                 ctx.source_base_url, ctx.dest_base_url, cached)
+    with ThreadPoolExecutor(max_workers=len(_SITE_COPY_STEPS)) as step_pool:
+        step_futures = [step_pool.submit(_deferred_call, step, *step_args) for step in _SITE_COPY_STEPS]
+        # Every step runs to completion, so replay all of their output before failing:
+        # a later step may have created objects even when an earlier one raised.
+        step_exc = None
+        for fut in step_futures:
+            events, _, exc = fut.result()
+            ui.replay(events)
+            if exc and step_exc is None:
+                step_exc = exc
+    if step_exc:
+        raise step_exc
+
+    source_site_details_for_sg = cached.get("details")
+    if source_site_details_for_sg is None:
+        source_site_details_for_sg = get_source_site_details(
+            ctx.source_session, site_plan["source_site_id"], base_url=ctx.source_base_url
+        )
+    new_sitegroup_ids, unmatched_sitegroups = resolve_sitegroup_ids(
+        source_site_details_for_sg,
+        ctx.source_sitegroup_id_to_name,
+        ctx.new_sitegroup_name_to_id,
+    )
+    if unmatched_sitegroups:
+        ui.warn(f"Unmatched site groups for '{site_plan['new_site_name']}': {', '.join(str(x) for x in unmatched_sitegroups)}")
+
+    site_fields = {}
+    if new_sitegroup_ids:
+        site_fields["sitegroup_ids"] = new_sitegroup_ids
+    source_alarm_id = source_site_details_for_sg.get("alarmtemplate_id")
+    if source_alarm_id:
+        new_alarm_id = ctx.source_alarm_to_new_id.get(source_alarm_id)
+        if new_alarm_id:
+            site_fields["alarmtemplate_id"] = new_alarm_id
+        else:
+            ui.warn(f"Alarm template ID '{source_alarm_id}' could not be remapped — no matching name found in new org.")
+
+    if ctx.assignment_mode == "4":
+        source_site_details = source_site_details_for_sg
+        source_template_ids = derive_source_site_template_ids(
+            source_site_details,
+            site_id=site_plan["source_site_id"],
+            wlan_site_map=ctx.wlan_site_map,
+            wlan_org_level_ids=ctx.wlan_org_level_ids,
+        )
+        resolved_template_ids = resolve_template_ids_from_source(
+            source_site_details,
+            ctx.source_maps,
+            ctx.new_maps,
+            source_ids=source_template_ids,
+        )
+        template_ids = resolved_template_ids
+        skip_reasons = compute_mode4_skip_reasons(
+            source_template_ids,
+            resolved_template_ids,
+            ctx.source_maps
+        )
+    elif ctx.assignment_mode == "1":
+        template_ids = site_template_ids
+    else:
+        template_ids = ctx.global_template_ids
+
+    template_ids = normalize_template_ids(template_ids)
+
+    site_wlan = template_ids.pop("wlan_template_id", None)
+    org_wlan  = template_ids.pop("wlan_org_template_id", None)
+
+    assigned_templates = []
+    if not any(template_ids.values()):
+        ui.info("No non-WLAN templates selected for assignment.")
+        if site_fields:
+            api_request(ctx.dest_session, "PUT", f'{ctx.dest_base_url}/sites/{new_site_id}', payload=site_fields)
+    else:
+        ui.progress("Assigning non-WLAN templates …")
+        assigned_templates = assign_templates(ctx.dest_session, ctx.new_org_id, new_site_id, template_ids,
+                                              base_url=ctx.dest_base_url, extra_fields=site_fields)
+    if new_sitegroup_ids:
+        ui.ok(f"Site group membership applied: {len(new_sitegroup_ids)} group(s).")
+    if "alarmtemplate_id" in site_fields:
+        ui.ok(f"Alarm template '{ctx.source_alarm_id_to_name[source_alarm_id]}' assigned.")
+
+    display_ids = dict(template_ids)
+    if site_wlan:
+        display_ids["wlan_template_id"] = site_wlan
+    if org_wlan:
+        display_ids["wlan_org_template_id"] = org_wlan
+    if display_ids:
+        assigned_names = format_assigned_template_names(display_ids, ctx.new_id_name_map)
+        ui.info(f"Deferred WLAN + non-WLAN plan: {assigned_names}")
+
+    if skip_reasons:
+        warning_summary = format_template_skip_warnings(skip_reasons)
+        ui.warn(f"Template assignment warnings: {warning_summary}")
+
+    return new_site_id, site_wlan, org_wlan, len(assigned_templates)
+
+
+def _copy_site_settings_step(source_session, dest_session, source_site_id, new_site_id,
+                             source_base_url, dest_base_url, cached):
+    ui.progress("Copying site settings …")
+    copy_site_settings(
+        source_session, source_site_id, new_site_id,
+        source_base_url=source_base_url, dest_base_url=dest_base_url,
+        dest_session=dest_session,
+        _cached_settings=cached.get("settings"),
+    )
+    ui.ok("Site settings copied.")
+
+
+def _clone_site_wlans_step(source_session, dest_session, source_site_id, new_site_id,
+                           source_base_url, dest_base_url, cached):
+    ui.progress("Copying site-specific WLANs …")
+    wlan_count = clone_site_wlans(
+        source_session, dest_session,
+        source_site_id, new_site_id,
+        source_base_url=source_base_url, dest_base_url=dest_base_url,
+        _cached_wlans=cached.get("wlans"),
+    )
+    if wlan_count:
+        ui.ok(f"Site-specific WLANs copied: {wlan_count}")
+    else:
+        ui.info("No site-specific WLANs found.")
+
+
+def _clone_site_maps_step(source_session, dest_session, source_site_id, new_site_id,
+                          source_base_url, dest_base_url, cached):
+    ui.progress("Copying site floor plan maps …")
+    maps_count = clone_site_maps(
+        source_session, dest_session,
+        source_site_id, new_site_id,
+        source_base_url=source_base_url, dest_base_url=dest_base_url,
+        _cached_maps=cached.get("maps"),
+    )
+    if maps_count:
+        ui.ok(f"Site maps copied: {maps_count}")
+    else:
+        ui.info("No site maps found.")
+
+
+_SITE_COPY_STEPS = (_copy_site_settings_step, _clone_site_wlans_step, _clone_site_maps_step)
+
+
+def _deferred_call(fn, *args):
+    with ui.deferred() as events:
+        try:
+            return events, fn(*args), None
+        except Exception as exc:
+            return events, None, exc
+
+
 def _setup_dest_context(source_session, source_base_url):
-    ui.section("Step 1b — Destination Instance")
+    ui.section("Step 2b — Destination Instance")
     ui.menu("Clone Mode", [
         ("1", "Same cloud instance (default)"),
         ("2", "Different cloud instance (cross-cloud)"),
@@ -345,26 +484,87 @@ def _setup_dest_context(source_session, source_base_url):
             'Content-Type': 'application/json',
             'Authorization': f'Token {dest_cfg.api_token}'
         }
-        dest_session = build_session(extra_headers=dest_headers)
         dest_base_url = dest_cfg.base_url
+        dest_session = build_session(extra_headers=dest_headers, pool_size=SITE_PHASE_POOL_SIZE,
+                                     base_url=dest_base_url)
         ui.ok(f"Destination: {dest_section_name}  ({dest_base_url})")
         return dest_session, dest_base_url, True
 
     return source_session, source_base_url, False
 
 
+def _template_name_map(cfg: RunConfig) -> dict:
+    return {
+        "switch_template_id": cfg.switch_template_name,
+        "wan_edge_template_id": cfg.wan_edge_template_name,
+        "wlan_template_id": cfg.wlan_template_name,
+        "rftemplate_id": cfg.rf_template_name
+    }
+
+
+def _run_preflight_with_dest_setup(source_session, source_base_url, cfg: RunConfig, template_name_map):
+    # Preflight is read-only on the source org, so it runs (with its output held back)
+    # while the destination instance is chosen and its session built.
+    with ThreadPoolExecutor(max_workers=1) as ex:
+        preflight_future = ex.submit(
+            _deferred_call, build_preflight_report,
+            source_session, cfg.source_organization_id, cfg.source_site_id,
+            template_name_map, cfg, source_base_url,
+        )
+        dest_session, dest_base_url, cross_cloud = _setup_dest_context(source_session, source_base_url)
+        events, preflight_report, exc = preflight_future.result()
+    ui.replay(events)
+    if exc:
+        raise exc
+    preflight_summary(preflight_report, template_assignment_mode=cfg.template_assignment_mode)
+    return preflight_report, dest_session, dest_base_url, cross_cloud
+
+
+def _write_preflight_report(preflight_report, path, cfg: RunConfig,
+                            markdown=False, pretty=False) -> None:
+    if path.endswith(".md") or markdown:
+        md_content = build_preflight_markdown(preflight_report,
+                                              template_assignment_mode=cfg.template_assignment_mode)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(md_content)
+    else:
+        with open(path, "w", encoding="utf-8") as file:
+            if pretty:
+                json.dump(preflight_report, file, indent=2, sort_keys=True)
+            else:
+                json.dump(preflight_report, file, separators=(",", ":"))
+    ui.ok(f"Preflight report written to {path}")
+
+
+def _run_log_header() -> str:
+    return (
+        "# Mist Org Clone — Run Log\n\n"
+        f"*Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*\n\n"
+        "---\n\n"
+    )
+
+
+def _start_run_log(path=None) -> None:
+    if path:
+        ui.start_log(path, header=_run_log_header())
+    else:
+        ui.start_log()
+
+
 def _write_run_log(path: str) -> None:
-    lines = ui.get_log_lines()
+    log_text = "\n".join(ui.iter_log_lines())
     with open(path, "w", encoding="utf-8") as f:
-        f.write("# Mist Org Clone — Run Log\n\n")
-        f.write(f"*Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*\n\n")
-        f.write("---\n\n")
-        for line in lines:
-            f.write(line + "\n")
+        f.write(_run_log_header())
+        f.write(log_text + "\n")
     ui.ok(f"Run log saved to {path}")
 
 
 def _offer_save_log() -> None:
+    streamed_path = ui.log_path()
+    if streamed_path:
+        ui.ok(f"Run log saved to {streamed_path}")
+        ui.stop_log()
+        return
     if ui.ask_yn("Save a full run log to a Markdown file?", default=True):
         log_path = ui.ask("Log filename", default="clone_log.md")
         _write_run_log(log_path)